@@ -1,13 +1,25 @@
+import os
 import subprocess
 import sys
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from pathlib import Path
 import csv
+import gzip
 
-from fastapi import Request
+from fastapi import Request, Response
 import dotenv
 
+from src.search_index import load_search_index, search
+from src.rollups import DIMENSIONS, load_rollups, rollup_rows
+from src.transaction_table import TransactionTable
+from src.recurring import load_recurring
+from src.assistant import FinancialAssistant, make_client
+from src.dashboard_bundle import BUNDLE_FILENAME
+from src.data_snapshot import SnapshotManager
+from src.publish import list_generations, rollback_generation
+
 app = FastAPI()
 
 # Allow CORS for local frontend
@@ -50,18 +62,223 @@ async def set_token(request: Request):
 
 
 # Helper to read CSV and return list of dicts
-def read_csv(filename):
-    file_path = DATA_DIR / filename
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail=f"File {filename} not found")
+def read_csv_rows(file_path):
     with open(file_path, newline='', encoding='utf-8') as csvfile:
         reader = csv.DictReader(csvfile)
         return list(reader)
 
+def read_csv(filename):
+    return load_cached(filename, read_csv_rows)
+
+# Parsed files of the published data generation, warmed before a new generation is swapped in
+snapshots = SnapshotManager(DATA_DIR, loaders=[
+    ('transactions.csv', TransactionTable.load),
+    ('card_balances.csv', read_csv_rows),
+    ('cash_balances.csv', read_csv_rows),
+    ('investment_balances.csv', read_csv_rows),
+    ('investment_history.csv', read_csv_rows),
+    ('search_index.json', load_search_index),
+    ('rollups.json', load_rollups),
+    ('recurring.json', load_recurring),
+])
+
+@app.on_event("startup")
+def start_snapshot_watcher():
+    snapshots.refresh()
+    snapshots.start()
+
+def load_cached(filename, loader, snapshot=None):
+    snapshot = snapshot or snapshots.current()
+    try:
+        return snapshot.load(filename, loader)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"File {filename} not found. Run the extraction first.")
+
+@app.get("/api/generation")
+def get_generation():
+    return {"current": snapshots.current().generation, "available": list_generations(DATA_DIR)}
+
+@app.post("/api/rollback")
+def rollback_data():
+    previous = rollback_generation(DATA_DIR)
+    if previous is None:
+        raise HTTPException(status_code=409, detail="No earlier generation to roll back to")
+    snapshots.refresh()
+    return {"status": "success", "current": previous}
+
+@app.get("/api/search")
+def search_transactions(
+    q: str = "",
+    account_name: list[str] | None = Query(None),
+    account_type: list[str] | None = Query(None),
+    category_name: list[str] | None = Query(None),
+    status: list[str] | None = Query(None),
+    start_date: str | None = None,
+    end_date: str | None = None,
+    amount_sign: str | None = None,
+    prefix: bool = True,
+    fuzzy: bool = False,
+    page: int = 1,
+    page_size: int = 50,
+):
+    try:
+        filters = {
+            "account_name": account_name,
+            "account_type": account_type,
+            "category_name": category_name,
+            "status": status,
+        }
+        # Index and table from the same generation so row ids line up
+        snapshot = snapshots.current()
+        return search(load_cached('search_index.json', load_search_index, snapshot),
+                      load_cached('transactions.csv', TransactionTable.load, snapshot),
+                      q, filters=filters, prefix=prefix, fuzzy=fuzzy, page=page, page_size=min(page_size, 500),
+                      start_date=start_date, end_date=end_date, amount_sign=amount_sign)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/rollups")
+def get_rollups():
+    try:
+        rollups = load_cached('rollups.json', load_rollups)
+        return {dimension: rollup_rows(rollups, dimension) for dimension in DIMENSIONS}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/rollups/{dimension}")
+def get_rollup(dimension: str):
+    if dimension not in DIMENSIONS:
+        raise HTTPException(status_code=404, detail=f"Unknown rollup {dimension}")
+    try:
+        return rollup_rows(load_cached('rollups.json', load_rollups), dimension)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/dashboard")
+def get_dashboard(request: Request):
+    try:
+        try:
+            bundle, compressed = snapshots.current().dashboard_bundle()
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Dashboard bundle not found. Run the extraction first.")
+        etag = f'"{bundle["version"]}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=compressed, media_type="application/json", headers=headers)
+        return Response(content=gzip.decompress(compressed), media_type="application/json", headers=headers)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/recurring")
+def get_recurring():
+    try:
+        return load_cached('recurring.json', load_recurring)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# AI assistant; created on first use so a missing API key only affects this endpoint
+_assistant = None
+
+def get_assistant():
+    global _assistant
+    if _assistant is None:
+        api_key = os.environ.get("GEMINI_API_KEY") or dotenv.get_key('.env', 'VITE_GEMINI_API_KEY')
+        _assistant = FinancialAssistant(make_client(api_key=api_key))
+    return _assistant
+
+@app.post("/api/assistant")
+async def ask_assistant(request: Request):
+    data = await request.json()
+    question = data.get("question")
+    if not question or not isinstance(question, str):
+        raise HTTPException(status_code=400, detail="Missing or invalid question.")
+    snapshot = snapshots.current()
+
+    sources = [('rollups.json', load_rollups), ('recurring.json', load_recurring)]
+
+    def load_sources():
+        try:
+            loaded = [snapshot.dashboard_bundle()[0]]
+        except FileNotFoundError:
+            loaded = [None]
+        for filename, loader in sources:
+            try:
+                loaded.append(snapshot.load(filename, loader))
+            except FileNotFoundError:
+                loaded.append(None)
+        return loaded
+
+    def answer():
+        # Every file the context is built from; the generation alone is None in the flat layout
+        signature = snapshot.signature([BUNDLE_FILENAME] + [filename for filename, _ in sources])
+        data_version = f"{snapshot.generation}:{signature}"
+        return get_assistant().ask(question, data_version, load_sources)
+
+    try:
+        return await run_in_threadpool(answer)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/transactions")
-def get_transactions():
+def get_transactions(
+    request: Request,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    account_name: str | None = None,
+    category_name: str | None = None,
+    merchant_name: str | None = None,
+):
+    try:
+        table = load_cached('transactions.csv', TransactionTable.load)
+        if start_date or end_date or account_name or category_name or merchant_name:
+            rows = table.filter(start_date, end_date, account_name=account_name,
+                                category_name=category_name, merchant_name=merchant_name)
+            return Response(content=table.to_json(rows), media_type="application/json")
+        # The full list is only kept gzip-compressed; decompress for the rare client that can't take it
+        compressed = table.to_json_gzip()
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            return Response(content=compressed, media_type="application/json",
+                            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
+        return Response(content=gzip.decompress(compressed), media_type="application/json",
+                        headers={"Vary": "Accept-Encoding"})
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/transactions/summary")
+def get_transactions_summary(
+    group_by: str | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    account_name: str | None = None,
+    category_name: str | None = None,
+):
     try:
-        return read_csv('transactions.csv')
+        table = load_cached('transactions.csv', TransactionTable.load)
+        if group_by and group_by not in table.dictionary:
+            raise HTTPException(status_code=400, detail=f"Cannot group by {group_by}")
+        rows = table.filter(start_date, end_date, account_name=account_name, category_name=category_name)
+        if group_by:
+            return table.group_totals(group_by, rows)
+        return table.totals(rows)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
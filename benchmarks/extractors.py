@@ -0,0 +1,373 @@
+"""
+Extractor benchmark and output regression suite.
+
+    python -m benchmarks.extractors                          # all scales, compare with baseline.json
+    python -m benchmarks.extractors --scales 1,10 --repeat 3
+    python -m benchmarks.extractors --threshold 0.10         # fail on >10% slowdown / memory growth
+    python -m benchmarks.extractors --update-baseline        # accept the current numbers
+
+Every extractor in src.utils runs on the scrubbed golden fixtures in
+benchmarks/fixtures/ and on synthetic copies scaled up 10x-1000x
+(benchmarks/synthetic.py). KarmaSracper.extract_all_to_csv runs end to end in
+a scratch Data/ directory. For each case it records:
+
+    seconds_median / seconds_min   wall time over --repeat runs
+    records_per_second, mb_per_second
+    peak_bytes                     tracemalloc peak during one run
+    allocated_blocks               memory blocks the run allocated and had not freed when it
+                                   returned (tracemalloc `count` statistics diffed across the run)
+    output_sha256                  hash of every CSV the case wrote
+
+Output at scale 1 must match benchmarks/fixtures/golden/*.csv line for line.
+At every scale it must also hash the same as in the baseline. Timings and
+memory are compared with the baseline using --threshold. The baseline is
+machine specific: regenerate it with --update-baseline on the machine that
+runs the comparison.
+"""
+import argparse
+import contextlib
+import gc
+import hashlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from benchmarks.synthetic import FIXTURES_DIR, SCALERS, scaled_payload
+from src.batch import RAW_OUTPUTS
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_DIR = os.path.join(FIXTURES_DIR, "golden")
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(BENCHMARKS_DIR, "results.json")
+
+DEFAULT_SCALES = [1, 10, 100, 1000]
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25
+# Timings below this are dominated by noise and never count as regressions
+MIN_SECONDS = 0.02
+
+END_TO_END = "extract_all_to_csv"
+
+# Extractor -> (raw fixture, output CSV)
+EXTRACTOR_CASES = {
+    extractor: (raw_name, output_csv)
+    for raw_name, outputs in RAW_OUTPUTS.items()
+    for _, extractor, output_csv in outputs
+}
+
+
+def sha256_files(paths):
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(os.path.basename(path).encode("utf-8"))
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _quiet(function, *args):
+    # Extractors print summaries; keep them out of the report but still pay for formatting them
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args)
+
+
+def time_runs(setup, run, repeat):
+    """
+    Times `run(state)` `repeat` times after one untimed warm-up run, calling the
+    untimed `setup()` before each run. Returns (durations, last result).
+    """
+    run(setup())
+    durations = []
+    result = None
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+        start = time.perf_counter()
+        result = run(state)
+        durations.append(time.perf_counter() - start)
+    return durations, result
+
+
+def profile_run(setup, run):
+    """
+    One run under tracemalloc: peak traced bytes during the run, and the blocks it
+    allocated, summed over the per-line `count` growth between snapshots taken
+    before and after it. Setup is traced too, so blocks it allocated and the run
+    freed lower the count instead of hiding behind it.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        state = setup()
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        result = run(state)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    allocated_blocks = sum(max(stat.count_diff, 0) for stat in after.compare_to(before, "lineno"))
+    return {"peak_bytes": peak, "allocated_blocks": allocated_blocks}, result
+
+
+def _summarize(durations, records, input_bytes, profile, output_sha256):
+    median = statistics.median(durations)
+    return {
+        "records": records,
+        "input_bytes": input_bytes,
+        "seconds_median": round(median, 6),
+        "seconds_min": round(min(durations), 6),
+        "records_per_second": round(records / median, 1) if median else None,
+        "mb_per_second": round(input_bytes / median / 1e6, 2) if median else None,
+        **profile,
+        "output_sha256": output_sha256,
+    }
+
+
+def bench_extractor(extractor, scale, repeat, scratch_dir):
+    from src import utils
+
+    raw_name, output_csv = EXTRACTOR_CASES[extractor]
+    payload = scaled_payload(raw_name, scale)
+    input_bytes = len(json.dumps(payload).encode("utf-8"))
+    output_path = os.path.join(scratch_dir, f"{extractor}-x{scale}-{output_csv}")
+    function = getattr(utils, extractor)
+
+    def setup():
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        return payload
+
+    def run(data):
+        return _quiet(function, data, output_path)
+
+    durations, records = time_runs(setup, run, repeat)
+    profile, _ = profile_run(setup, run)
+    return _summarize(durations, records or 0, input_bytes, profile, sha256_files([output_path])), output_path
+
+
+def _write_workspace(root, scale):
+    data_dir = os.path.join(root, "Data")
+    os.makedirs(data_dir)
+    for raw_name in SCALERS:
+        with open(os.path.join(data_dir, raw_name), 'w', encoding='utf-8') as f:
+            json.dump(scaled_payload(raw_name, scale), f)
+    return root
+
+
+def bench_extract_all(scale, repeat, scratch_dir):
+    """
+    KarmaSracper.extract_all_to_csv in a fresh Data/ per run: every extractor plus the
+    derived search index, rollups, recurring report and dashboard bundle, staged and published.
+    """
+    from KarmaSracper import extract_all_to_csv
+
+    template = _write_workspace(os.path.join(scratch_dir, f"extract_all-x{scale}-template"), scale)
+    input_bytes = sum(os.path.getsize(os.path.join(template, "Data", name)) for name in SCALERS)
+    runs = []
+
+    def setup():
+        workspace = os.path.join(scratch_dir, f"extract_all-x{scale}-run{len(runs)}")
+        shutil.copytree(template, workspace)
+        runs.append(workspace)
+        return workspace
+
+    def run(workspace):
+        previous = os.getcwd()
+        os.chdir(workspace)
+        try:
+            _quiet(extract_all_to_csv)
+        finally:
+            os.chdir(previous)
+        return workspace
+
+    durations, workspace = time_runs(setup, run, repeat)
+    profile, _ = profile_run(setup, run)
+
+    current = os.path.join(workspace, "Data", "current")
+    outputs = [os.path.join(current, output_csv) for output_csv in sorted({o for _, o in EXTRACTOR_CASES.values()})]
+    records = 0
+    for path in outputs:
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                records += max(sum(1 for _ in f) - 1, 0)
+    for path in runs:
+        shutil.rmtree(path, ignore_errors=True)
+    return _summarize(durations, records, input_bytes, profile, sha256_files(outputs))
+
+
+def check_golden(extractor, output_path):
+    """
+    Compares a scale-1 output with its golden CSV. Returns None when identical, else a description.
+    """
+    golden_path = os.path.join(GOLDEN_DIR, EXTRACTOR_CASES[extractor][1])
+    if not os.path.exists(golden_path):
+        return f"{extractor}: golden file {golden_path} is missing"
+    if not os.path.exists(output_path):
+        return f"{extractor}: wrote no output"
+    with open(golden_path, 'r', encoding='utf-8', newline='') as f:
+        expected = f.read().splitlines()
+    with open(output_path, 'r', encoding='utf-8', newline='') as f:
+        actual = f.read().splitlines()
+    if expected == actual:
+        return None
+    for number, (want, got) in enumerate(zip(expected, actual), start=1):
+        if want != got:
+            return f"{extractor}: line {number} differs\n    golden: {want}\n    actual: {got}"
+    return f"{extractor}: {len(actual)} lines, golden has {len(expected)}"
+
+
+def compare_with_baseline(cases, baseline, threshold):
+    """
+    Returns (regressions, output changes) relative to the baseline's cases.
+    """
+    regressions = []
+    changed = []
+    for key, result in cases.items():
+        previous = baseline.get("cases", {}).get(key)
+        if previous is None:
+            continue
+        if previous.get("output_sha256") != result["output_sha256"]:
+            changed.append(key)
+        # The fastest run is the least noisy timing (as with timeit); the median is reported for context
+        for metric in ("seconds_min", "peak_bytes", "allocated_blocks"):
+            before, after = previous.get(metric), result.get(metric)
+            if before is None or after is None:
+                continue
+            if metric == "seconds_min" and max(before, after) < MIN_SECONDS:
+                continue
+            # A zero baseline still counts: any growth from it is a regression
+            if after > before * (1 + threshold):
+                growth = f"+{(after / before - 1) * 100:.0f}%" if before else "up from zero"
+                regressions.append(f"{key}: {metric} {before} -> {after} ({growth})")
+    return regressions, changed
+
+
+def run_suite(extractors, scales, repeat, end_to_end=True):
+    """
+    Runs every (extractor, scale) case. Returns ({case key: result}, golden mismatches).
+    """
+    cases = {}
+    golden = []
+    scratch_dir = tempfile.mkdtemp(prefix="extractor-bench-")
+    try:
+        for scale in scales:
+            for extractor in extractors:
+                key = f"{extractor}@x{scale}"
+                result, output_path = bench_extractor(extractor, scale, repeat, scratch_dir)
+                cases[key] = result
+                print(f"[LOG] {key}: {result['records']} records, {result['seconds_median'] * 1000:.2f} ms, "
+                      f"{result['records_per_second']} rec/s, peak {result['peak_bytes'] / 1024:.0f} KiB")
+                if scale == 1:
+                    mismatch = check_golden(extractor, output_path)
+                    if mismatch:
+                        golden.append(mismatch)
+            if end_to_end:
+                key = f"{END_TO_END}@x{scale}"
+                # End-to-end runs are much slower at large scales; fewer repeats keep the suite usable
+                result = bench_extract_all(scale, max(1, min(repeat, 3)), scratch_dir)
+                cases[key] = result
+                print(f"[LOG] {key}: {result['records']} records, {result['seconds_median'] * 1000:.2f} ms, "
+                      f"peak {result['peak_bytes'] / 1024:.0f} KiB")
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+    return cases, golden
+
+
+def parse_scales(value):
+    try:
+        scales = [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Scales must be comma-separated integers, got {value!r}")
+    if not scales or min(scales) < 1:
+        raise argparse.ArgumentTypeError("Scales must be positive")
+    return scales
+
+
+def parse_extractors(value):
+    selected = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in selected if name not in EXTRACTOR_CASES and name != END_TO_END]
+    if unknown:
+        choices = ", ".join(list(EXTRACTOR_CASES) + [END_TO_END])
+        raise argparse.ArgumentTypeError(f"Unknown extractor(s): {', '.join(unknown)}. Choose from {choices}")
+    return selected
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.extractors", description="Extractor benchmarks")
+    parser.add_argument("--scales", type=parse_scales, default=DEFAULT_SCALES,
+                        help=f"Comma-separated payload scale factors (default {','.join(map(str, DEFAULT_SCALES))})")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per case")
+    parser.add_argument("--only", type=parse_extractors, default=None,
+                        help=f"Comma-separated extractors to run, including {END_TO_END}. Defaults to all.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline results JSON")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Where to write this run's results JSON")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative growth in time, peak memory and allocations (0.25 = 25%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="Write this run's results as the new baseline")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    selected = args.only or list(EXTRACTOR_CASES) + [END_TO_END]
+    extractors = [name for name in selected if name != END_TO_END]
+
+    cases, golden = run_suite(extractors, args.scales, args.repeat, END_TO_END in selected)
+    results = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "cases": cases,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print(f"[SUCCESS] Wrote {len(cases)} benchmark results to {args.output}")
+
+    failed = False
+    for mismatch in golden:
+        failed = True
+        print(f"[ERROR] Golden output mismatch: {mismatch}")
+
+    if args.update_baseline:
+        baseline = {"cases": {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        # Merge so a partial run (--only / --scales) only replaces the cases it measured
+        baseline.update({key: value for key, value in results.items() if key != "cases"})
+        baseline.setdefault("cases", {}).update(cases)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"[SUCCESS] Updated baseline {args.baseline}")
+        return 1 if failed else 0
+
+    if not os.path.exists(args.baseline):
+        print(f"[ERROR] No baseline at {args.baseline}; run with --update-baseline first")
+        return 1
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions, changed = compare_with_baseline(cases, baseline, args.threshold)
+    for key in changed:
+        failed = True
+        print(f"[ERROR] Output changed: {key} no longer matches the baseline output hash")
+    for regression in regressions:
+        failed = True
+        print(f"[ERROR] Regression beyond {args.threshold * 100:.0f}%: {regression}")
+    if not failed:
+        print(f"[SUCCESS] {len(cases)} cases within {args.threshold * 100:.0f}% of baseline; outputs identical")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
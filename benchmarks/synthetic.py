@@ -0,0 +1,103 @@
+"""
+Deterministic synthetic payloads: the golden fixtures scaled up by an integer factor.
+
+Copy n of every account, card, chart and transaction gets a distinct id, name
+or date, so the extractors' de-duplication doesn't collapse the copies and
+the output grows with the factor (a 100x payload yields ~100x the rows).
+"""
+import copy
+import json
+import os
+from datetime import date, timedelta
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def load_fixture(raw_name):
+    with open(os.path.join(FIXTURES_DIR, raw_name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _suffix_account_ids(node, suffix):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "accountId" and isinstance(value, str):
+                node[key] = f"{value}-{suffix}"
+            else:
+                _suffix_account_ids(value, suffix)
+    elif isinstance(node, list):
+        for value in node:
+            _suffix_account_ids(value, suffix)
+
+
+def scale_card_balances(payload, factor):
+    payload = copy.deepcopy(payload)
+    insight = payload["data"]["myWalletInsights"]["getMyWalletInsight"]
+    content = insight["content"]
+    scaled = list(content)
+    for n in range(1, factor):
+        for item in content:
+            item = copy.deepcopy(item)
+            _suffix_account_ids(item, n)
+            scaled.append(item)
+    insight["content"] = scaled
+    return payload
+
+
+def _rename_view(view, n):
+    """
+    Distinct titles, account numbers and chart labels for copy n of a networth view.
+    """
+    for span in view.get("rowTitle", {}).get("spans", []):
+        if span.get("text"):
+            span["text"] = f"{span['text']} {n}"
+    for span in view.get("rowStatusDot", {}).get("statusDotText", {}).get("spans", []):
+        if span.get("text"):
+            span["text"] = span["text"].replace(")", f"{n})", 1)
+    for data_set in view.get("dataVisualizationGroupDataSets", []):
+        data_set["dataSetKey"] = f"{data_set.get('dataSetKey', '')}-{n}"
+
+
+def scale_networth(payload, factor):
+    payload = copy.deepcopy(payload)
+    networth = payload["data"]["prime"]["networthByAccountType"]
+    cards = networth["cards"]
+    scaled = list(cards)
+    for n in range(1, factor):
+        for card in cards:
+            card = copy.deepcopy(card)
+            for view in card.get("item", {}).get("views", []):
+                _rename_view(view, n)
+            scaled.append(card)
+    networth["cards"] = scaled
+    return payload
+
+
+def scale_transactions(payload, factor):
+    scaled = list(payload)
+    for n in range(1, factor):
+        for transaction in payload:
+            transaction = copy.deepcopy(transaction)
+            transaction["id"] = f"{transaction.get('id', '')}-{n}"
+            try:
+                day = date.fromisoformat(transaction.get("date", "")) - timedelta(days=30 * n)
+                transaction["date"] = day.isoformat()
+            except ValueError:
+                pass
+            scaled.append(transaction)
+    return scaled
+
+
+SCALERS = {
+    "card_balances.json": scale_card_balances,
+    "cash_balances.json": scale_networth,
+    "investment_balances.json": scale_networth,
+    "transactions.json": scale_transactions,
+}
+
+
+def scaled_payload(raw_name, factor):
+    payload = load_fixture(raw_name)
+    if factor <= 1:
+        return payload
+    return SCALERS[raw_name](payload, factor)
@@ -33,11 +33,10 @@ import {
   loadCashBalances,
   loadInvestmentBalances,
   loadInvestmentHistory,
+  loadDashboardBundle,
   formatCurrency,
   calculateNetWorth,
   getCardColors,
-  groupTransactionsByCategory,
-  getMonthlySpending,
   getAccountTypeBreakdown,
   processInvestmentHistory
 } from './utils/dataUtils';
@@ -57,6 +56,12 @@ const Dashboard = () => {
     transactions: []
   });
   const [loading, setLoading] = useState(true);
+  // The bootstrap bundle only carries recent transactions; monthly and category
+  // charts wait for the full list so they never show totals over a subset
+  const [transactionsLoaded, setTransactionsLoaded] = useState(false);
+  // Headline numbers and the newest transactions from the bundle; null/empty without one
+  const [aggregates, setAggregates] = useState(null);
+  const [recentTransactions, setRecentTransactions] = useState([]);
   const [selectedPeriod, setSelectedPeriod] = useState('3M');
   const [theme, setTheme] = useState('dark');
   const [hoveredValue, setHoveredValue] = useState(null);
@@ -107,15 +112,20 @@ const Dashboard = () => {
   // Helper to reload all dashboard data
   const reloadAllData = async () => {
     try {
-      const [cards, cash, investments, investmentHistory, transactions] = await Promise.all([
+      const [bundle, cards, cash, investments, investmentHistory, transactions] = await Promise.all([
+        loadDashboardBundle(),
         loadCardBalances(),
         loadCashBalances(),
         loadInvestmentBalances(),
         loadInvestmentHistory(),
         loadTransactions()
       ]);
+      setAggregates(bundle ? bundle.aggregates : null);
+      setRecentTransactions(bundle ? bundle.recent_transactions : []);
       setData({ cards, cash, investments, investmentHistory, transactions });
     } catch (error) {
+      setAggregates(null);
+      setRecentTransactions([]);
       setData({ cards: [], cash: [], investments: [], investmentHistory: [], transactions: [] });
     }
   };
@@ -173,23 +183,36 @@ const Dashboard = () => {
     const loadAllData = async () => {
       try {
         console.log('Starting to load data...');
-        const [cards, cash, investments, investmentHistory, transactions] = await Promise.all([
-          loadCardBalances(),
-          loadCashBalances(),
-          loadInvestmentBalances(),
-          loadInvestmentHistory(),
-          loadTransactions()
-        ]);
-
-        console.log('Data loaded:', { cards, cash, investments, investmentHistory, transactions });
+        // Paint from the bootstrap bundle: it carries every balance, the downsampled
+        // history and the headline aggregates, so first paint needs one request
+        const bundle = await loadDashboardBundle();
+        let balances;
+        if (bundle) {
+          balances = {
+            cards: bundle.balances.cards,
+            cash: bundle.balances.cash,
+            investments: bundle.balances.investments,
+            investmentHistory: bundle.investment_history
+          };
+          setAggregates(bundle.aggregates);
+          setRecentTransactions(bundle.recent_transactions);
+        } else {
+          const [cards, cash, investments, investmentHistory] = await Promise.all([
+            loadCardBalances(),
+            loadCashBalances(),
+            loadInvestmentBalances(),
+            loadInvestmentHistory()
+          ]);
+          balances = { cards, cash, investments, investmentHistory };
+        }
+        setData(prev => ({ ...prev, ...balances }));
+        setLoading(false);
 
-        setData({
-          cards,
-          cash,
-          investments,
-          investmentHistory,
-          transactions
-        });
+        // The full transaction list only feeds the analytics charts; fetch it after first paint
+        const transactions = await loadTransactions();
+        console.log('Data loaded:', { ...balances, transactions });
+        setData(prev => ({ ...prev, transactions }));
+        setTransactionsLoaded(true);
       } catch (error) {
         console.error('Error loading data:', error);
         setData({
@@ -199,6 +222,7 @@ const Dashboard = () => {
           investmentHistory: [],
           transactions: []
         });
+        setTransactionsLoaded(true);
       } finally {
         setLoading(false);
       }
@@ -429,45 +453,21 @@ const Dashboard = () => {
     );
   }
 
-  // Calculate key metrics
-  const creditCardDebt = Math.abs(calculateNetWorth(data.cards));
-  // Add pending income and expenses to cash balance, but only for BANK accounts of type 'Checking'
-  const pendingIncome = data.transactions
-    .filter(t =>
-      t.status === 'PENDING' &&
-      t.account_type === 'BANK' &&
-      (t.account_subtype?.toLowerCase() === 'checking' || t.account_name?.toLowerCase().includes('checking')) &&
-      parseFloat(t.amount_value || 0) > 0
-    )
+  // Calculate key metrics; the bundle's aggregates already include pending checking
+  // activity, otherwise it is added once the full transaction list has loaded
+  const isPendingChecking = (t) =>
+    t.status === 'PENDING' &&
+    t.account_type === 'BANK' &&
+    (t.account_subtype?.toLowerCase() === 'checking' || t.account_name?.toLowerCase().includes('checking'));
+  const pendingCash = data.transactions
+    .filter(isPendingChecking)
     .reduce((sum, t) => sum + parseFloat(t.amount_value || 0), 0);
-  const pendingExpenses = data.transactions
-    .filter(t =>
-      t.status === 'PENDING' &&
-      t.account_type === 'BANK' &&
-      (t.account_subtype?.toLowerCase() === 'checking' || t.account_name?.toLowerCase().includes('checking')) &&
-      parseFloat(t.amount_value || 0) < 0
-    )
-    .reduce((sum, t) => sum + parseFloat(t.amount_value || 0), 0);
-  const cashBalance = calculateNetWorth(data.cash) + pendingIncome + pendingExpenses;
-  const investmentBalance = calculateNetWorth(data.investments);
-  const netWorth = cashBalance + investmentBalance - creditCardDebt;
-
-  // Calculate monthly spending
-  const thisMonth = new Date();
-  const thisMonthTransactions = data.transactions.filter(t => {
-    const transactionDate = new Date(t.date);
-    return transactionDate.getMonth() === thisMonth.getMonth() && 
-           transactionDate.getFullYear() === thisMonth.getFullYear();
-  });
-  
-  const monthlySpending = thisMonthTransactions.reduce((total, t) => {
-    const amount = parseFloat(t.amount_value || 0);
-    return amount < 0 ? total + Math.abs(amount) : total;
-  }, 0);
+  const creditCardDebt = aggregates ? aggregates.credit_card_debt : Math.abs(calculateNetWorth(data.cards));
+  const cashBalance = aggregates ? aggregates.cash_balance : calculateNetWorth(data.cash) + pendingCash;
+  const investmentBalance = aggregates ? aggregates.investment_balance : calculateNetWorth(data.investments);
+  const netWorth = aggregates ? aggregates.net_worth : cashBalance + investmentBalance - creditCardDebt;
 
   // Prepare chart data with sophisticated colors
-  const categoryData = groupTransactionsByCategory(data.transactions);
-  const monthlyData = getMonthlySpending(data.transactions);
   const accountBreakdown = getAccountTypeBreakdown(data.cards, data.cash, data.investments);
 
   // Generate sample trend data for stat cards
@@ -731,6 +731,12 @@ const Dashboard = () => {
             <h2 className="text-lg font-semibold text-[var(--text-accent)] mb-1">Monthly Analytics</h2>
             <p className="text-sm text-[var(--text-secondary)]">Visualize your income, spending, and category breakdowns</p>
           </section>
+          {!transactionsLoaded ? (
+          <div className="flex items-center justify-center gap-3 py-16 text-[var(--text-secondary)]">
+            <div className="w-6 h-6 border-2 border-[var(--accent-primary)] border-t-transparent rounded-full animate-spin"></div>
+            <span className="text-sm font-medium">Loading all transactions...</span>
+          </div>
+          ) : (
           <div className="flex flex-col md:flex-row gap-6">
             {/* Monthly Income/Spending Bar Chart Card - Modern Figma Style */}
             <Card className="flex-1 min-w-[320px]">
@@ -977,6 +983,7 @@ const Dashboard = () => {
               </CardContent>
             </Card>
           </div>
+          )}
           
           {/* Section 4: Transaction Search */}
           <section className="flex-grow flex flex-col min-h-0">
@@ -986,7 +993,7 @@ const Dashboard = () => {
             </div>
             <div className="flex-grow min-h-0" style={{ minHeight: '500px' }}>
               <TransactionSearch 
-                transactions={data.transactions} 
+                transactions={recentTransactions} 
               />
             </div>
           </section>
@@ -994,7 +1001,6 @@ const Dashboard = () => {
         {/* Right side: Financial AI Assistant */}
         <aside className="lg:flex flex-col w-128 max-w-full h-full">
           <FinancialAIAssistant 
-            transactions={data.transactions} 
             cardBalances={data.cards} 
             cashBalances={data.cash}
             investmentBalances={data.investments}
@@ -1,6 +1,7 @@
 
 import React, { useState, useRef, useEffect } from 'react';
 import { Bot, Send, X } from 'lucide-react';
+import { askAssistant } from '../utils/dataUtils';
 
 const FinancialAIAssistant = ({ transactions = [] }) => {
   const [messages, setMessages] = useState([
@@ -23,46 +24,6 @@ const FinancialAIAssistant = ({ transactions = [] }) => {
 
   // No file upload needed; data comes from props
 
-  // Call Gemini API
-  const callGemini = async (prompt) => {
-    try {
-      const apiKey = import.meta.env.VITE_GEMINI_API_KEY;
-      if (!apiKey) {
-        throw new Error('VITE_GEMINI_API_KEY not found in environment variables');
-      }
-
-      const response = await fetch(`https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash-latest:generateContent?key=${apiKey}`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          contents: [{
-            parts: [{
-              text: prompt
-            }]
-          }],
-          generationConfig: {
-            temperature: 0.7,
-            topK: 40,
-            topP: 0.95,
-            maxOutputTokens: 2048,
-          }
-        })
-      });
-
-      if (!response.ok) {
-        throw new Error(`API request failed: ${response.status}`);
-      }
-
-      const data = await response.json();
-      return data.candidates[0].content.parts[0].text;
-    } catch (error) {
-      console.error('Gemini API Error:', error);
-      throw error;
-    }
-  };
-
   // Handle user question
   const handleAskQuestion = async () => {
     if (!query.trim() || isLoading) return;
@@ -78,21 +39,8 @@ const FinancialAIAssistant = ({ transactions = [] }) => {
     setIsLoading(true);
 
     try {
-      // Only use transactions for the prompt
-      const prompt = `You are a financial analyst. Here is the user's transaction data in JSON format:
-
-Transactions (${transactions.length} records):
-${JSON.stringify(transactions, null, 2)}
-
-User Question: ${userQuestion}
-
-Please analyze this transaction data and provide a short answers to the point answer with numbers and analysis. Use markdown formatting for better readability.
-
-- Use ## for headers, **bold** for emphasis, and - for bullet points
-
-Answer the user's question directly using the actual data provided.`;
-
-      const response = await callGemini(prompt);
+      // The backend builds a compact context from precomputed summaries and caches answers
+      const { answer: response } = await askAssistant(userQuestion);
 
       setMessages(prev => [...prev, {
         role: 'assistant',
@@ -104,7 +52,7 @@ Answer the user's question directly using the actual data provided.`;
       console.error('Error:', error);
       setMessages(prev => [...prev, {
         role: 'assistant',
-        content: `❌ Sorry, I encountered an error: ${error.message}. Please check your API key configuration.`,
+        content: `❌ Sorry, I encountered an error: ${error.message}. Please check the backend's Gemini API key configuration.`,
         timestamp: new Date()
       }]);
     }
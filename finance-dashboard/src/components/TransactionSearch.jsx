@@ -47,7 +47,12 @@ import {
   CardTitle, 
   CardContent 
 } from './ui/Card';
-import { loadCardBalances, loadCashBalances } from '../utils/dataUtils';
+import { loadCardBalances, loadCashBalances, searchTransactions } from '../utils/dataUtils';
+
+// Every filter is applied by /api/search; facet dropdowns list the values and counts it returns
+const SEARCH_FACET_FIELDS = ['account_name', 'account_type', 'category_name', 'status'];
+const SEARCH_PAGE_SIZE = 100;
+const SEARCH_DEBOUNCE_MS = 150;
 
 // Helper function to format currency
 const formatCurrency = (value) => {
@@ -82,8 +87,14 @@ const TransactionSearch = ({ transactions = [] }) => {
   const [cardBalances, setCardBalances] = useState([]);
   const [cashBalances, setCashBalances] = useState([]);
   const [selectedCategories, setSelectedCategories] = useState([]);
+  const [searchResults, setSearchResults] = useState(null);
+  const [searchTotal, setSearchTotal] = useState(0);
+  const [searchPage, setSearchPage] = useState(1);
+  const [searchFacets, setSearchFacets] = useState({});
+  const [searchLoading, setSearchLoading] = useState(false);
   const scrollContainerRef = useRef(null);
   const filterMenuRef = useRef(null);
+  const searchRequestRef = useRef(0);
 
   // Load card and cash balances for images and icons
   useEffect(() => {
@@ -101,6 +112,67 @@ const TransactionSearch = ({ transactions = [] }) => {
     loadBalanceData();
   }, []);
   
+  // All filters in the shape /api/search expects: facet values, a date range and an amount sign
+  const searchFilters = useMemo(() => {
+    const filters = {};
+    SEARCH_FACET_FIELDS.forEach(field => {
+      if (Array.isArray(filterValues[field]) && filterValues[field].length > 0) {
+        filters[field] = filterValues[field];
+      }
+    });
+
+    const types = filterValues['transaction-type'] || [];
+    // Both types selected is the same as no type filter
+    if (types.length === 1) {
+      filters.amount_sign = types[0] === 'income' ? 'income' : 'expense';
+    }
+
+    if (filterValues['date-range']) {
+      const now = new Date();
+      let startDate = new Date();
+      if (filterValues['date-range'] === '30days') {
+        startDate.setDate(now.getDate() - 30);
+      } else if (filterValues['date-range'] === '90days') {
+        startDate.setDate(now.getDate() - 90);
+      } else if (filterValues['date-range'] === 'ytd') {
+        startDate = new Date(now.getFullYear(), 0, 1); // January 1st of current year
+      }
+      const pad = (n) => String(n).padStart(2, '0');
+      filters.start_date = `${startDate.getFullYear()}-${pad(startDate.getMonth() + 1)}-${pad(startDate.getDate())}`;
+    }
+    return filters;
+  }, [filterValues]);
+
+  // The list, its total and the facet counts all come from the backend index, so
+  // every page it returns already matches every filter. Responses to superseded
+  // queries are dropped.
+  useEffect(() => {
+    const query = searchQuery.trim();
+    const requestId = ++searchRequestRef.current;
+    const timer = setTimeout(async () => {
+      setSearchLoading(true);
+      const response = await searchTransactions(query, { filters: searchFilters, page: 1, pageSize: SEARCH_PAGE_SIZE });
+      if (requestId !== searchRequestRef.current) return;
+      setSearchResults(response?.results || []);
+      setSearchTotal(response?.total || 0);
+      setSearchFacets(response?.facets || {});
+      setSearchPage(1);
+      setSearchLoading(false);
+    }, query ? SEARCH_DEBOUNCE_MS : 0);
+    return () => clearTimeout(timer);
+  }, [searchQuery, searchFilters]);
+
+  const loadMoreSearchResults = async () => {
+    if (searchLoading || !searchResults || searchResults.length >= searchTotal) return;
+    const requestId = searchRequestRef.current;
+    setSearchLoading(true);
+    const response = await searchTransactions(searchQuery.trim(), { filters: searchFilters, page: searchPage + 1, pageSize: SEARCH_PAGE_SIZE });
+    if (requestId !== searchRequestRef.current) return;
+    setSearchResults(prev => [...(prev || []), ...(response?.results || [])]);
+    setSearchPage(searchPage + 1);
+    setSearchLoading(false);
+  };
+
   // Close filter menu when clicking outside
   useEffect(() => {
     const handleClickOutside = (event) => {
@@ -113,10 +185,24 @@ const TransactionSearch = ({ transactions = [] }) => {
     return () => document.removeEventListener('mousedown', handleClickOutside);
   }, []);
 
-  // Extract unique values for filter fields
+  // Dropdown options for a facet field from the server's counts, most frequent first.
+  // Selected values stay listed even when the other filters leave them no hits.
+  const facetOptions = (field, idPrefix) => {
+    const counts = { ...(searchFacets[field] || {}) };
+    (Array.isArray(filterValues[field]) ? filterValues[field] : []).forEach(value => {
+      if (!(value in counts)) counts[value] = 0;
+    });
+    return Object.entries(counts)
+      .sort((a, b) => b[1] - a[1] || a[0].localeCompare(b[0]))
+      .map(([value, count]) => ({
+        id: `${idPrefix}-${value.toLowerCase().replace(/\s+/g, '-')}`,
+        label: value,
+        count,
+        value
+      }));
+  };
+
   const filterOptions = useMemo(() => {
-    const options = {};
-    
     // Define filter categories and their fields
     const categories = {
       'Transaction Type': {
@@ -139,43 +225,27 @@ const TransactionSearch = ({ transactions = [] }) => {
       'Account': {
         field: 'account_name',
         isMultiSelect: true,
-        options: [...new Set(transactions.map(t => t.account_name).filter(Boolean))].map(name => ({
-          id: `account-${name.toLowerCase().replace(/\s+/g, '-')}`,
-          label: name,
-          value: name
-        }))
+        options: facetOptions('account_name', 'account')
       },
       'Account Type': {
         field: 'account_type',
         isMultiSelect: true,
-        options: [...new Set(transactions.map(t => t.account_type).filter(Boolean))].map(type => ({
-          id: `account-type-${type.toLowerCase()}`,
-          label: type,
-          value: type
-        }))
+        options: facetOptions('account_type', 'account-type')
       },
       'Category': {
         field: 'category_name',
         isMultiSelect: true,
-        options: [...new Set(transactions.map(t => t.category_name).filter(Boolean))].map(category => ({
-          id: `category-${category.toLowerCase().replace(/\s+/g, '-')}`,
-          label: category,
-          value: category
-        }))
+        options: facetOptions('category_name', 'category')
       },
       'Status': {
         field: 'status',
         isMultiSelect: true,
-        options: [...new Set(transactions.map(t => t.status).filter(Boolean))].map(status => ({
-          id: `status-${status.toLowerCase()}`,
-          label: status,
-          value: status
-        }))
+        options: facetOptions('status', 'status')
       }
     };
     
     return categories;
-  }, [transactions]);
+  }, [searchFacets, filterValues]);
   
   // Toggle a category in the selected categories list
   const toggleCategory = (category) => {
@@ -238,59 +308,8 @@ const TransactionSearch = ({ transactions = [] }) => {
     return filters;
   }, [filterValues, filterOptions]);
 
-  // Apply filters to transactions
-  const filteredTransactions = useMemo(() => {
-    let results = [...transactions];
-    
-    // Apply transaction type filters
-    if (Array.isArray(filterValues['transaction-type'])) {
-      if (filterValues['transaction-type'].includes('expenses')) {
-        // If both expenses and income are selected, this is a no-op filter
-        if (!filterValues['transaction-type'].includes('income')) {
-          results = results.filter(t => parseFloat(t.amount_value) < 0);
-        }
-      } else if (filterValues['transaction-type'].includes('income')) {
-        results = results.filter(t => parseFloat(t.amount_value) > 0);
-      }
-    }
-    
-    // Date range filters
-    if (filterValues['date-range']) {
-      const now = new Date();
-      let startDate = new Date();
-      
-      if (filterValues['date-range'] === '30days') {
-        startDate.setDate(now.getDate() - 30);
-      } else if (filterValues['date-range'] === '90days') {
-        startDate.setDate(now.getDate() - 90);
-      } else if (filterValues['date-range'] === 'ytd') {
-        startDate = new Date(now.getFullYear(), 0, 1); // January 1st of current year
-      }
-      
-      results = results.filter(t => new Date(t.date) >= startDate);
-    }
-    
-    // Apply field-based multi-select filters
-    const fieldFilters = ['account_name', 'account_type', 'category_name', 'status'];
-    fieldFilters.forEach(field => {
-      const values = filterValues[field];
-      if (Array.isArray(values) && values.length > 0) {
-        results = results.filter(t => values.includes(t[field]));
-      }
-    });
-    
-    // Apply search query if present
-    const query = searchQuery.trim().toLowerCase();
-    if (query) {
-      results = results.filter(t =>
-        (t.description?.toLowerCase().includes(query)) ||
-        (t.category_name?.toLowerCase().includes(query)) ||
-        (t.merchant_name?.toLowerCase().includes(query))
-      );
-    }
-    
-    return results;
-  }, [searchQuery, transactions, filterValues]);
+  // Server results once the first response arrives; until then the rows passed in
+  const filteredTransactions = searchResults !== null ? searchResults : transactions;
 
   // Reset visible count and scroll to top when the list changes
   useEffect(() => {
@@ -300,18 +319,28 @@ const TransactionSearch = ({ transactions = [] }) => {
     }
   }, [searchQuery, filterValues, transactions]);
 
-  // Infinite scroll handler
-  const handleScroll = () => {
+  // Show more rows (fetching the next page when the loaded ones run out) once the
+  // list is scrolled to within 150px of its bottom, or doesn't fill the view at all
+  const showMoreIfNearBottom = () => {
     const container = scrollContainerRef.current;
     if (container) {
       const { scrollTop, scrollHeight, clientHeight } = container;
-      // Load more when user is 150px from the bottom
       if (scrollHeight - scrollTop <= clientHeight + 150) {
         setVisibleCount(prevCount => Math.min(prevCount + 20, filteredTransactions.length));
+        if (visibleCount + 20 >= filteredTransactions.length) {
+          loadMoreSearchResults();
+        }
       }
     }
   };
 
+  const handleScroll = showMoreIfNearBottom;
+
+  // A short list never scrolls, so check after every change instead of waiting for a scroll event
+  useEffect(() => {
+    showMoreIfNearBottom();
+  }, [filteredTransactions, visibleCount, searchLoading]);
+
   // Attach and clean up scroll listener
   useEffect(() => {
     const container = scrollContainerRef.current;
@@ -323,7 +352,7 @@ const TransactionSearch = ({ transactions = [] }) => {
         container.removeEventListener('scroll', handleScroll);
       }
     };
-  }, [filteredTransactions]); // Re-attach if filtered list changes
+  }, [filteredTransactions, visibleCount, searchLoading]); // Re-attach so the handler sees current state
 
   // Apply a filter (supporting multi-select)
   const applyFilter = (field, value, isMultiSelect) => {
@@ -591,6 +620,9 @@ function getAccountImageUrl(transaction, cardBalances = [], cashBalances = []) {
                                     )}
                                   </span>
                                   <span className="text-sm truncate">{option.label}</span>
+                                  {option.count !== undefined && (
+                                    <span className="ml-auto pl-2 text-xs text-[var(--text-secondary)]">{option.count}</span>
+                                  )}
                                 </button>
                               );
                             })}
@@ -648,7 +680,7 @@ function getAccountImageUrl(transaction, cardBalances = [], cashBalances = []) {
             </div>
           )}
           
-          {visibleCount < filteredTransactions.length && (
+          {(visibleCount < filteredTransactions.length || (searchResults !== null && searchResults.length < searchTotal)) && (
             <div className="text-center py-4 text-sm text-[var(--text-secondary)]">
               Loading more...
             </div>
@@ -31,6 +31,37 @@ export const loadInvestmentHistory = async () => {
   return await loadAPIData(`${API_BASE}/investment_history`);
 };
 
+// Single precomputed bundle for first paint: balances, recent transactions,
+// headline aggregates and downsampled investment history (see /api/dashboard)
+export const loadDashboardBundle = async () => {
+  const bundle = await loadAPIData(`${API_BASE}/dashboard`);
+  return Array.isArray(bundle) ? null : bundle;
+};
+
+// Ask the backend AI assistant; it builds a compact context from precomputed summaries
+export const askAssistant = async (question) => {
+  const response = await fetch(`${API_BASE}/assistant`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ question }),
+  });
+  if (!response.ok) {
+    const body = await response.json().catch(() => ({}));
+    throw new Error(body.detail || `API error: ${response.status}`);
+  }
+  return await response.json();
+};
+
+// Server-side ranked search with facet counts (see /api/search in app.py).
+// `filters` holds facet values plus start_date/end_date (YYYY-MM-DD) and amount_sign ('income' | 'expense')
+export const searchTransactions = async (query, { filters = {}, fuzzy = false, page = 1, pageSize = 50 } = {}) => {
+  const params = new URLSearchParams({ q: query, fuzzy, page, page_size: pageSize });
+  Object.entries(filters).forEach(([field, values]) => {
+    (Array.isArray(values) ? values : [values]).forEach(value => params.append(field, value));
+  });
+  return await loadAPIData(`${API_BASE}/search?${params.toString()}`);
+};
+
 // export const loadCSVData = async (filename) => {
 //   try {
 //     const response = await fetch(`/data/${filename}`);
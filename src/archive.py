@@ -0,0 +1,310 @@
+"""
+Content-addressed, compressed archive of raw GraphQL responses.
+
+Every document passed to archive_response() is split into subtrees: any
+object or array whose serialized form is at least SUBTREE_MIN_BYTES is
+stored once under the SHA-256 of its content and replaced in its parent by
+a {"$cas": <hash>} reference. Identical documents, and the identical Fabric
+layout fragments repeated between runs, therefore cost nothing after the
+first copy. Blobs are compressed with zstd (using a dictionary trained on
+the archive when one exists) and fall back to zlib when the optional
+zstandard package is not installed. Snapshots are indexed by tenant,
+dataset and time in SQLite.
+
+    Data/archive/
+      objects/ab/abcdef...   compressed blobs
+      dicts/<id>.zdict       trained zstd dictionaries (dicts/current names the active one)
+      index.sqlite           snapshots(tenant, dataset, taken_at, root_hash, raw_bytes)
+"""
+import hashlib
+import json
+import os
+import random
+import sqlite3
+import struct
+import zlib
+from datetime import datetime
+
+from src.utils import atomic_open
+
+ARCHIVE_DIR = os.environ.get("CK_ARCHIVE_DIR", "Data/archive")
+DEFAULT_TENANT = os.environ.get("CK_TENANT", "default")
+
+REF_KEY = "$cas"
+SUBTREE_MIN_BYTES = 256
+# Inline writes happen during every fetch and favour speed; `train-dict --recompress`
+# rewrites the whole archive offline and can afford the strongest level
+ZSTD_LEVEL = 3
+ZSTD_RECOMPRESS_LEVEL = 19
+DICT_SIZE = 112 * 1024
+DICT_SAMPLES = 5000
+
+# Blob header: one codec byte, plus a uint32 dictionary id for zstd (0 = none)
+CODEC_ZLIB = b"z"
+CODEC_ZSTD = b"s"
+
+
+def _zstd():
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+
+def _dumps(node):
+    return json.dumps(node, separators=(",", ":"), ensure_ascii=False)
+
+
+class RawArchive:
+    def __init__(self, archive_dir=ARCHIVE_DIR):
+        self.archive_dir = archive_dir
+        self.objects_dir = os.path.join(archive_dir, "objects")
+        self.dicts_dir = os.path.join(archive_dir, "dicts")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.dicts_dir, exist_ok=True)
+        self._dicts = {}
+        # Active dictionary id, read from dicts/current on first use
+        self._dict_id = None
+        # (dict id, level) -> ZstdCompressor, reused for every blob
+        self._compressors = {}
+        self._db = sqlite3.connect(os.path.join(archive_dir, "index.sqlite"))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            " id INTEGER PRIMARY KEY, tenant TEXT NOT NULL, dataset TEXT NOT NULL,"
+            " taken_at TEXT NOT NULL, root_hash TEXT NOT NULL, raw_bytes INTEGER NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS snapshots_by_time ON snapshots (tenant, dataset, taken_at)"
+        )
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+    # -- compression ---------------------------------------------------------
+
+    def _dictionary(self, dict_id):
+        zstandard = _zstd()
+        if dict_id not in self._dicts:
+            with open(os.path.join(self.dicts_dir, f"{dict_id}.zdict"), 'rb') as f:
+                self._dicts[dict_id] = zstandard.ZstdCompressionDict(f.read())
+        return self._dicts[dict_id]
+
+    def current_dict_id(self):
+        path = os.path.join(self.dicts_dir, "current")
+        if not os.path.exists(path):
+            return 0
+        with open(path, 'r') as f:
+            return int(f.read().strip() or 0)
+
+    def _compressor(self, zstandard, dict_id, level):
+        key = (dict_id, level)
+        if key not in self._compressors:
+            if dict_id:
+                self._compressors[key] = zstandard.ZstdCompressor(level=level, dict_data=self._dictionary(dict_id))
+            else:
+                self._compressors[key] = zstandard.ZstdCompressor(level=level)
+        return self._compressors[key]
+
+    def _compress(self, raw, level=ZSTD_LEVEL):
+        zstandard = _zstd()
+        if zstandard is None:
+            return CODEC_ZLIB + zlib.compress(raw, 9)
+        if self._dict_id is None:
+            self._dict_id = self.current_dict_id()
+        compressor = self._compressor(zstandard, self._dict_id, level)
+        return CODEC_ZSTD + struct.pack(">I", self._dict_id) + compressor.compress(raw)
+
+    def _decompress(self, blob):
+        codec, body = blob[:1], blob[1:]
+        if codec == CODEC_ZLIB:
+            return zlib.decompress(body)
+        zstandard = _zstd()
+        if zstandard is None:
+            raise RuntimeError("Archive blob is zstd-compressed; install the zstandard package to read it")
+        dict_id = struct.unpack(">I", body[:4])[0]
+        if dict_id:
+            decompressor = zstandard.ZstdDecompressor(dict_data=self._dictionary(dict_id))
+        else:
+            decompressor = zstandard.ZstdDecompressor()
+        return decompressor.decompress(body[4:])
+
+    # -- blobs ---------------------------------------------------------------
+
+    def _blob_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def _put(self, raw):
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            with atomic_open(path, 'wb') as f:
+                f.write(self._compress(raw))
+        return digest
+
+    def _get(self, digest):
+        with open(self._blob_path(digest), 'rb') as f:
+            return self._decompress(f.read())
+
+    def _store_node(self, node):
+        """
+        Stores large subtrees bottom-up and returns the node with them replaced by references.
+        """
+        if isinstance(node, dict):
+            node = {key: self._store_node(value) for key, value in node.items()}
+        elif isinstance(node, list):
+            node = [self._store_node(value) for value in node]
+        else:
+            return node
+        raw = _dumps(node).encode("utf-8")
+        if len(raw) < SUBTREE_MIN_BYTES:
+            return node
+        return {REF_KEY: self._put(raw)}
+
+    def _resolve(self, node):
+        if isinstance(node, dict):
+            if len(node) == 1 and REF_KEY in node:
+                return self._resolve(json.loads(self._get(node[REF_KEY])))
+            return {key: self._resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [self._resolve(value) for value in node]
+        return node
+
+    # -- snapshots -----------------------------------------------------------
+
+    def add(self, data, dataset, tenant=DEFAULT_TENANT, taken_at=None):
+        """
+        Archives one raw response and returns its root hash.
+        """
+        taken_at = taken_at or datetime.now().isoformat(timespec="seconds")
+        root = self._store_node(data)
+        if not (isinstance(root, dict) and len(root) == 1 and REF_KEY in root):
+            # Small documents are still stored as a single blob so every snapshot has a hash
+            root = {REF_KEY: self._put(_dumps(root).encode("utf-8"))}
+        raw_bytes = len(_dumps(data).encode("utf-8"))
+        self._db.execute(
+            "INSERT INTO snapshots (tenant, dataset, taken_at, root_hash, raw_bytes) VALUES (?, ?, ?, ?, ?)",
+            (tenant, dataset, taken_at, root[REF_KEY], raw_bytes),
+        )
+        self._db.commit()
+        return root[REF_KEY]
+
+    def load(self, root_hash):
+        return self._resolve({REF_KEY: root_hash})
+
+    def snapshots(self, tenant=None, dataset=None, since=None, until=None, limit=None):
+        """
+        Snapshot rows (newest first) filtered by tenant, dataset and an ISO time range.
+        """
+        query = "SELECT tenant, dataset, taken_at, root_hash, raw_bytes FROM snapshots WHERE 1=1"
+        params = []
+        for column, op, value in [("tenant", "=", tenant), ("dataset", "=", dataset),
+                                  ("taken_at", ">=", since), ("taken_at", "<=", until)]:
+            if value is not None:
+                query += f" AND {column} {op} ?"
+                params.append(value)
+        query += " ORDER BY taken_at DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(int(limit))
+        columns = ["tenant", "dataset", "taken_at", "root_hash", "raw_bytes"]
+        return [dict(zip(columns, row)) for row in self._db.execute(query, params)]
+
+    def latest(self, dataset, tenant=DEFAULT_TENANT, before=None):
+        rows = self.snapshots(tenant=tenant, dataset=dataset, until=before, limit=1)
+        return self.load(rows[0]["root_hash"]) if rows else None
+
+    def stats(self):
+        blob_count = stored_bytes = 0
+        for directory, _, files in os.walk(self.objects_dir):
+            for name in files:
+                if not name.startswith("."):
+                    blob_count += 1
+                    stored_bytes += os.path.getsize(os.path.join(directory, name))
+        snapshot_count, raw_bytes = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(raw_bytes), 0) FROM snapshots"
+        ).fetchone()
+        return {
+            "snapshots": snapshot_count,
+            "blobs": blob_count,
+            "raw_bytes": raw_bytes,
+            "stored_bytes": stored_bytes,
+            "ratio": round(raw_bytes / stored_bytes, 1) if stored_bytes else None,
+            "dictionary": self.current_dict_id(),
+        }
+
+    # -- dictionary training -------------------------------------------------
+
+    def _blob_paths(self):
+        for directory, _, files in os.walk(self.objects_dir):
+            for name in files:
+                if not name.startswith("."):
+                    yield os.path.join(directory, name)
+
+    def train_dictionary(self, size=DICT_SIZE, samples=DICT_SAMPLES, recompress=False):
+        """
+        Trains a zstd dictionary on a sample of archived blobs and makes it the active one.
+        With `recompress`, existing blobs are rewritten with it. Returns the dictionary id.
+        """
+        zstandard = _zstd()
+        if zstandard is None:
+            raise RuntimeError("Training a dictionary requires the zstandard package")
+        paths = list(self._blob_paths())
+        random.shuffle(paths)
+        sample_data = []
+        for path in paths[:samples]:
+            with open(path, 'rb') as f:
+                sample_data.append(self._decompress(f.read()))
+        dictionary = zstandard.train_dictionary(size, sample_data)
+        dict_id = dictionary.dict_id()
+        with atomic_open(os.path.join(self.dicts_dir, f"{dict_id}.zdict"), 'wb') as f:
+            f.write(dictionary.as_bytes())
+        with atomic_open(os.path.join(self.dicts_dir, "current"), 'w') as f:
+            f.write(str(dict_id))
+        self._dict_id = dict_id
+        print(f"[SUCCESS] Trained dictionary {dict_id} on {len(sample_data)} blobs")
+
+        if recompress:
+            for path in paths:
+                with open(path, 'rb') as f:
+                    raw = self._decompress(f.read())
+                with atomic_open(path, 'wb') as f:
+                    f.write(self._compress(raw, ZSTD_RECOMPRESS_LEVEL))
+            print(f"[SUCCESS] Recompressed {len(paths)} blobs with dictionary {dict_id}")
+        return dict_id
+
+
+def archive_response(data, dataset, tenant=DEFAULT_TENANT, archive_dir=ARCHIVE_DIR, taken_at=None):
+    """
+    Convenience wrapper used by save_json: archives one response and logs its hash.
+    """
+    try:
+        archive = RawArchive(archive_dir)
+        try:
+            root_hash = archive.add(data, dataset, tenant, taken_at)
+        finally:
+            archive.close()
+        print(f"[LOG] Archived {dataset} as {root_hash[:12]}")
+        return root_hash
+    except Exception as e:
+        print(f"[ERROR] Failed to archive {dataset}: {e}")
+        return None
+
+
+def export_snapshots(output_root, archive_dir=ARCHIVE_DIR, tenant=None, dataset=None, since=None, until=None):
+    """
+    Materializes archived snapshots as <output_root>/<tenant>/<taken_at>/<dataset>.json,
+    the layout `python -m src.cli reextract` consumes.
+    """
+    archive = RawArchive(archive_dir)
+    try:
+        rows = archive.snapshots(tenant=tenant, dataset=dataset, since=since, until=until)
+        for row in rows:
+            directory = os.path.join(output_root, row["tenant"], row["taken_at"].replace(":", ""))
+            with atomic_open(os.path.join(directory, f"{row['dataset']}.json"), 'w', encoding='utf-8') as f:
+                json.dump(archive.load(row["root_hash"]), f)
+        print(f"[SUCCESS] Exported {len(rows)} snapshots to {output_root}")
+        return len(rows)
+    finally:
+        archive.close()
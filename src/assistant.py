@@ -0,0 +1,249 @@
+"""
+Backend for the dashboard's AI assistant.
+
+Builds a compact, token-budgeted context from precomputed summaries (the
+dashboard bundle, rollups and recurring charges) instead of raw
+transactions, and caches both the built contexts and model answers per
+data version. The model client is pluggable:
+
+    ASSISTANT_CLIENT=gemini                 (default) Gemini REST API
+    ASSISTANT_CLIENT=stub                   canned local answers, no network
+    ASSISTANT_CLIENT=package.module:factory any callable returning an object with generate(prompt)
+
+GEMINI_API_BASE can point the Gemini client at a local stub server.
+"""
+import importlib
+import math
+import os
+import re
+import threading
+from collections import OrderedDict
+
+DEFAULT_CONTEXT_TOKENS = 3000
+ANSWER_CACHE_SIZE = 256
+CONTEXT_CACHE_SIZE = 16
+
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+GEMINI_MODEL = "gemini-1.5-flash-latest"
+
+PROMPT_TEMPLATE = """You are a financial analyst. Here is a summary of the user's finances:
+
+{context}
+
+User Question: {question}
+
+Please analyze this data and provide a short answers to the point answer with numbers and analysis. Use markdown formatting for better readability.
+
+- Use ## for headers, **bold** for emphasis, and - for bullet points
+
+Answer the user's question directly using the actual data provided."""
+
+
+def estimate_tokens(text):
+    # ~4 characters per token is close enough for budgeting English + numbers
+    return math.ceil(len(text) / 4)
+
+
+def normalize_question(question):
+    text = re.sub(r"\s+", " ", (question or "").strip().lower())
+    return text.rstrip("?!. ")
+
+
+def _money(value):
+    return f"-${abs(value):,.2f}" if value < 0 else f"${value:,.2f}"
+
+
+def _context_sections(bundle, rollups, recurring):
+    """
+    (title, [lines]) in priority order; earlier sections are kept when the budget is tight.
+    """
+    sections = []
+    if bundle:
+        aggregates = bundle.get("aggregates", {})
+        sections.append(("Balances", [
+            f"- Net worth: {_money(aggregates.get('net_worth', 0))}",
+            f"- Cash: {_money(aggregates.get('cash_balance', 0))}",
+            f"- Investments: {_money(aggregates.get('investment_balance', 0))}",
+            f"- Credit card debt: {_money(aggregates.get('credit_card_debt', 0))}",
+            f"- Transactions on record: {aggregates.get('transaction_count', 0)}",
+        ]))
+
+    if recurring and recurring.get("forecast"):
+        forecast = recurring["forecast"]
+        lines = [
+            f"- As of {forecast['as_of']}, month-to-date net: {_money(forecast['month_to_date_net'])}",
+            f"- Expected recurring income before {forecast['month_end']}: {_money(forecast['expected_recurring_income'])}",
+            f"- Expected recurring expenses before {forecast['month_end']}: {_money(forecast['expected_recurring_expenses'])}",
+            f"- Projected month net: {_money(forecast['projected_month_net'])}",
+        ]
+        if "projected_month_end_cash" in forecast:
+            lines.append(f"- Projected month-end cash: {_money(forecast['projected_month_end_cash'])}")
+        sections.append(("Month-end forecast", lines))
+
+    if rollups:
+        months = rollups["tables"]["month"]
+        sections.append(("Monthly totals (month: income / expenses / net)", [
+            f"- {month}: {_money(months[month]['income'])} / {_money(months[month]['expenses'])} / {_money(months[month]['sum'])}"
+            for month in sorted(months, reverse=True)[:12]
+        ]))
+        categories = rollups["tables"]["category"]
+        sections.append(("Spending by category (all time)", [
+            f"- {name}: {_money(categories[name]['expenses'])} over {categories[name]['count']} transactions"
+            for name in sorted(categories, key=lambda n: categories[n]["expenses"], reverse=True)[:15]
+        ]))
+        merchants = rollups["tables"]["merchant"]
+        sections.append(("Top merchants by spending", [
+            f"- {name}: {_money(merchants[name]['expenses'])} over {merchants[name]['count']} transactions"
+            for name in sorted(merchants, key=lambda n: merchants[n]["expenses"], reverse=True)[:20]
+        ]))
+
+    if recurring and recurring.get("series"):
+        sections.append(("Recurring charges (merchant, period, average, next date)", [
+            f"- {s['merchant']}: {s['period']}, {_money(s['average_amount'])}, next {s['next_date']}"
+            for s in recurring["series"] if s["active"]
+        ][:25]))
+
+    if bundle and bundle.get("recent_transactions"):
+        sections.append(("Recent transactions (date, description, amount, category)", [
+            f"- {t.get('date', '')}: {t.get('description', '')[:40]}, {t.get('amount_currency') or t.get('amount_value', '')}, {t.get('category_name', '')}"
+            for t in bundle["recent_transactions"][:40]
+        ]))
+    return sections
+
+
+def build_context(bundle=None, rollups=None, recurring=None, budget_tokens=DEFAULT_CONTEXT_TOKENS):
+    """
+    Renders the summary sections as markdown, dropping trailing lines and
+    sections once `budget_tokens` is reached.
+    """
+    parts = []
+    used = 0
+    for title, lines in _context_sections(bundle, rollups, recurring):
+        header = f"## {title}"
+        if used + estimate_tokens(header) > budget_tokens:
+            break
+        kept = [header]
+        used += estimate_tokens(header)
+        for line in lines:
+            cost = estimate_tokens(line)
+            if used + cost > budget_tokens:
+                break
+            kept.append(line)
+            used += cost
+        if len(kept) == 1:
+            break
+        parts.append("\n".join(kept))
+    return "\n\n".join(parts)
+
+
+class StubClient:
+    """
+    Offline client for local development and tests: answers from the prompt itself.
+    """
+
+    def generate(self, prompt):
+        question = prompt.rsplit("User Question:", 1)[-1].split("\n", 1)[0].strip()
+        return f"## Stub answer\n\n- Question: {question}\n- Context size: {estimate_tokens(prompt)} tokens"
+
+
+class GeminiClient:
+    def __init__(self, api_key, model=GEMINI_MODEL, api_base=GEMINI_API_BASE, timeout=60):
+        self.api_key = api_key
+        self.model = model
+        self.api_base = api_base.rstrip("/")
+        self.timeout = timeout
+
+    def generate(self, prompt):
+        import requests
+
+        response = requests.post(
+            f"{self.api_base}/models/{self.model}:generateContent",
+            params={"key": self.api_key},
+            json={
+                "contents": [{"parts": [{"text": prompt}]}],
+                "generationConfig": {"temperature": 0.7, "topK": 40, "topP": 0.95, "maxOutputTokens": 2048},
+            },
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return response.json()["candidates"][0]["content"]["parts"][0]["text"]
+
+
+def make_client(name=None, api_key=None):
+    name = name or os.environ.get("ASSISTANT_CLIENT", "gemini")
+    if name == "stub":
+        return StubClient()
+    if name == "gemini":
+        if not api_key:
+            raise RuntimeError("GEMINI_API_KEY / VITE_GEMINI_API_KEY not configured")
+        return GeminiClient(
+            api_key,
+            model=os.environ.get("GEMINI_MODEL", GEMINI_MODEL),
+            api_base=os.environ.get("GEMINI_API_BASE", GEMINI_API_BASE),
+        )
+    module_name, _, factory = name.partition(":")
+    if not module_name or not factory:
+        raise ValueError(f"Unknown ASSISTANT_CLIENT {name!r}; expected 'gemini', 'stub' or 'module:factory'")
+    return getattr(importlib.import_module(module_name), factory)()
+
+
+class _LRU:
+    def __init__(self, size):
+        self.size = size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.size:
+                self._items.popitem(last=False)
+
+
+class FinancialAssistant:
+    """
+    Answers questions against precomputed summaries, caching contexts and answers per data version.
+    """
+
+    def __init__(self, client, budget_tokens=DEFAULT_CONTEXT_TOKENS):
+        self.client = client
+        self.budget_tokens = budget_tokens
+        self._contexts = _LRU(CONTEXT_CACHE_SIZE)
+        self._answers = _LRU(ANSWER_CACHE_SIZE)
+
+    def context(self, data_version, load_sources):
+        """
+        `load_sources()` returns (bundle, rollups, recurring) and is only called on a cache miss.
+        """
+        context = self._contexts.get(data_version)
+        if context is None:
+            bundle, rollups, recurring = load_sources()
+            context = build_context(bundle, rollups, recurring, self.budget_tokens)
+            self._contexts.put(data_version, context)
+        return context
+
+    def ask(self, question, data_version, load_sources):
+        """
+        A cached answer is returned without building (or loading the sources of) the context.
+        """
+        key = (data_version, normalize_question(question))
+        cached = self._answers.get(key)
+        if cached is not None:
+            answer, context_tokens = cached
+            return {"answer": answer, "cached": True, "data_version": data_version,
+                    "context_tokens": context_tokens}
+
+        context = self.context(data_version, load_sources)
+        answer = self.client.generate(PROMPT_TEMPLATE.format(context=context, question=question.strip()))
+        context_tokens = estimate_tokens(context)
+        self._answers.put(key, (answer, context_tokens))
+        return {"answer": answer, "cached": False, "data_version": data_version,
+                "context_tokens": context_tokens}
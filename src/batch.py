@@ -0,0 +1,254 @@
+"""
+Parallel batch re-extraction over archived raw snapshots.
+
+    python -m src.cli reextract ARCHIVE_ROOT [--out OUT] [--workers N] [--only cards,...] [--force]
+
+Every directory under ARCHIVE_ROOT holding one of the raw *.json dumps is a
+snapshot (e.g. archive/<tenant>/<date>/). Each raw file is re-extracted in a
+process pool into the matching directory under OUT. An output is skipped when
+its input's content hash and extractor version match the manifest from the
+previous run, so a backfill after an extractor fix only redoes that extractor.
+The manifest is flushed every MANIFEST_FLUSH_EVERY finished raw files, so an
+interrupted backfill resumes where it stopped instead of starting over.
+"""
+import contextlib
+import hashlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.utils import EXTRACTOR_VERSIONS, atomic_open
+
+MANIFEST_FILENAME = ".reextract_manifest.json"
+MANIFEST_FLUSH_EVERY = 50
+
+# Raw dump -> [(dataset, extractor name in src.utils, output CSV)]
+RAW_OUTPUTS = {
+    "card_balances.json": [("cards", "extract_card_balances_to_csv", "card_balances.csv")],
+    "cash_balances.json": [("cash", "extract_cash_balances_to_csv", "cash_balances.csv")],
+    "investment_balances.json": [
+        ("investments", "extract_investment_balances_to_csv", "investment_balances.csv"),
+        ("investment_history", "extract_investment_history_to_csv", "investment_history.csv"),
+    ],
+    "transactions.json": [("transactions", "extract_transactions_to_csv", "transactions.csv")],
+}
+
+# Extractors whose outputs extract_investments_to_csv writes in one traversal, in its argument order
+INVESTMENT_EXTRACTORS = ("extract_investment_balances_to_csv", "extract_investment_history_to_csv")
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def discover_snapshots(root):
+    """
+    Relative paths of every directory under `root` that contains at least one raw dump.
+    """
+    snapshots = []
+    for directory, subdirs, files in os.walk(root):
+        # Skip staging/hidden directories such as .staging-* generations
+        subdirs[:] = sorted(d for d in subdirs if not d.startswith("."))
+        if any(name in RAW_OUTPUTS for name in files):
+            snapshots.append(os.path.relpath(directory, root))
+    return snapshots
+
+
+def _load_manifest(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_manifest(path, manifest):
+    with atomic_open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def plan_jobs(root, out_root, datasets, manifest, force=False):
+    """
+    Returns (jobs, skipped). A job re-extracts one raw file into one or more outputs:
+    {"input", "input_hash", "outputs": [(extractor, output_path, manifest_key)]}.
+    """
+    jobs = []
+    skipped = 0
+    for snapshot in discover_snapshots(root):
+        for raw_name, outputs in RAW_OUTPUTS.items():
+            input_path = os.path.join(root, snapshot, raw_name)
+            if not os.path.exists(input_path):
+                continue
+            input_hash = file_sha256(input_path)
+            pending = []
+            for dataset, extractor, output_csv in outputs:
+                if dataset not in datasets:
+                    continue
+                output_path = os.path.join(out_root, snapshot, output_csv)
+                key = os.path.normpath(os.path.join(snapshot, output_csv))
+                previous = manifest.get(key)
+                up_to_date = (
+                    previous is not None
+                    and previous["input_hash"] == input_hash
+                    and previous["extractor_version"] == EXTRACTOR_VERSIONS[extractor]
+                    and (os.path.exists(output_path) or previous["records"] == 0)
+                )
+                if up_to_date and not force:
+                    skipped += 1
+                    continue
+                pending.append((extractor, output_path, key))
+            if pending:
+                jobs.append({"input": input_path, "input_hash": input_hash, "outputs": pending})
+    return jobs, skipped
+
+
+def _extractor_calls(outputs):
+    """
+    Groups a job's outputs into extractor calls: [(extractor, [output or None per output argument])].
+    Investment balances and history share one extract_investments_to_csv call.
+    """
+    investments = {output[0]: output for output in outputs if output[0] in INVESTMENT_EXTRACTORS}
+    calls = [(output[0], [output]) for output in outputs if output[0] not in INVESTMENT_EXTRACTORS]
+    if investments:
+        calls.append(("extract_investments_to_csv", [investments.get(name) for name in INVESTMENT_EXTRACTORS]))
+    return calls
+
+
+def run_job(job):
+    """
+    Worker: loads one raw dump once and runs its extractors with `raise_errors`, so
+    a failed extraction is told apart from one that legitimately found nothing.
+    Extractor chatter is captured so the parent's progress output stays readable.
+    An output that comes back empty has its previous CSV removed.
+    """
+    from src import utils
+
+    results = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            data = utils.load_from_json(job["input"])
+        except Exception as e:
+            return {"input": job["input"], "error": f"Failed to load: {e}", "results": []}
+    for extractor, outputs in _extractor_calls(job["outputs"]):
+        paths = [output[1] if output else None for output in outputs]
+        captured = io.StringIO()
+        error = None
+        with contextlib.redirect_stdout(captured):
+            for path in paths:
+                if path:
+                    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            try:
+                counts = getattr(utils, extractor)(data, *paths, raise_errors=True)
+            except Exception as e:
+                error = f"{extractor} failed: {e}"
+                counts = None
+        if not isinstance(counts, tuple):
+            counts = (counts,) * len(outputs)
+        log = captured.getvalue()
+        for output, records in zip(outputs, counts):
+            if output is None:
+                continue
+            _, output_path, key = output
+            if error is None and not records and os.path.exists(output_path):
+                os.remove(output_path)
+            results.append({
+                "extractor": output[0],
+                "output": output_path,
+                "key": key,
+                "records": records or 0,
+                "error": error,
+                "log": log,
+            })
+            # A combined call's log is reported once, with its first output
+            log = ""
+    return {"input": job["input"], "error": None, "results": results}
+
+
+def _record_results(job, result, manifest):
+    """
+    Records a finished job's outputs in the manifest. Failed extractions are left
+    out so the next run retries them. Returns (written, empty, failed, records).
+    """
+    written = empty = failed = records = 0
+    for output in result["results"]:
+        errors = [line for line in output["log"].splitlines() if line.startswith("[ERROR]")]
+        for line in errors:
+            print(f"  {job['input']}: {line}")
+        if output["error"]:
+            print(f"  {job['input']}: [ERROR] {output['error']}")
+            failed += 1
+            manifest.pop(output["key"], None)
+            continue
+        # Empty results are recorded too: same input and version would give the same nothing
+        manifest[output["key"]] = {
+            "input_hash": job["input_hash"],
+            "extractor": output["extractor"],
+            "extractor_version": EXTRACTOR_VERSIONS[output["extractor"]],
+            "records": output["records"],
+        }
+        if output["records"]:
+            written += 1
+            records += output["records"]
+        else:
+            empty += 1
+    return written, empty, failed, records
+
+
+def reextract(root, out_root=None, datasets=None, workers=None, force=False):
+    """
+    Re-extracts every stale output under `root`. Returns a summary dict.
+    """
+    out_root = out_root or root
+    datasets = set(datasets or [d for outputs in RAW_OUTPUTS.values() for d, _, _ in outputs])
+    manifest_path = os.path.join(out_root, MANIFEST_FILENAME)
+    manifest = _load_manifest(manifest_path)
+
+    start = time.perf_counter()
+    jobs, skipped = plan_jobs(root, out_root, datasets, manifest, force)
+    total = len(jobs)
+    print(f"[LOG] {total} raw files to re-extract, {skipped} outputs up to date")
+
+    written = empty = failed = records = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_job, job): job for job in jobs}
+        for done, future in enumerate(as_completed(futures), start=1):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"input": job["input"], "error": str(e), "results": []}
+
+            if result["error"]:
+                failed += len(job["outputs"])
+                print(f"[ERROR] [{done}/{total}] {job['input']}: {result['error']}")
+            else:
+                written_now, empty_now, failed_now, records_now = _record_results(job, result, manifest)
+                written += written_now
+                empty += empty_now
+                failed += failed_now
+                records += records_now
+                counts = ", ".join(f"{os.path.basename(o['output'])}={o['records']}" for o in result["results"])
+                print(f"[LOG] [{done}/{total}] {job['input']}: {counts}")
+
+            if done % MANIFEST_FLUSH_EVERY == 0:
+                _write_manifest(manifest_path, manifest)
+
+    _write_manifest(manifest_path, manifest)
+
+    summary = {
+        "raw_files": total,
+        "outputs_written": written,
+        "outputs_empty": empty,
+        "outputs_failed": failed,
+        "outputs_skipped": skipped,
+        "records": records,
+        "seconds": round(time.perf_counter() - start, 2),
+    }
+    print(f"[SUCCESS] Re-extraction finished: {written} outputs written ({records} records), "
+          f"{skipped} skipped as up to date, {empty} empty, {failed} failed in {summary['seconds']}s")
+    return summary
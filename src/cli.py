@@ -0,0 +1,393 @@
+"""
+Command line entry point for the scraper.
+
+    python -m src.cli fetch   [--only transactions,cards]
+    python -m src.cli extract [--only cards] [--format csv,parquet,feather]
+    python -m src.cli sync    [--only ...]      # fetch + extract
+    python -m src.cli generations               # list published generations
+    python -m src.cli rollback                  # re-publish the previous generation
+    python -m src.cli reextract ARCHIVE [--out DIR] [--workers N] [--force]
+    python -m src.cli archive {list,stats,restore,export,train-dict}
+    python -m src.cli check-startup [--budget-ms 250] [extract --only cards]
+
+fetch, extract and sync write into a staged copy of the current generation
+and publish it atomically when done (see src/publish.py).
+
+Only the standard library is imported at module level; requests, dotenv and
+the extractors are imported by the stage that needs them so selective runs
+(e.g. a re-extract of card balances) don't pay for the rest.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+DATA_DIR = "Data"
+
+DATASETS = ["transactions", "cards", "cash", "investments", "investment_history"]
+
+# Output formats for extract/sync; CSV is always written, the rest are optional columnar copies
+FORMATS = ["csv", "parquet", "feather"]
+
+# Dataset -> raw JSON written by the fetch stage
+RAW_FILES = {
+    "transactions": "transactions.json",
+    "cards": "card_balances.json",
+    "cash": "cash_balances.json",
+    "investments": "investment_balances.json",
+    "investment_history": "investment_balances.json",
+}
+
+# Dataset -> (extractor name in src.utils, output CSV)
+EXTRACTORS = {
+    "cards": ("extract_card_balances_to_csv", "card_balances.csv"),
+    "cash": ("extract_cash_balances_to_csv", "cash_balances.csv"),
+    "investments": ("extract_investment_balances_to_csv", "investment_balances.csv"),
+    "investment_history": ("extract_investment_history_to_csv", "investment_history.csv"),
+    "transactions": ("extract_transactions_to_csv", "transactions.csv"),
+}
+
+# Dataset -> fetcher name in src.credit_karma_scraper
+FETCHERS = {
+    "transactions": "fetch_transactions",
+    "cards": "fetch_card_balances",
+    "cash": "fetch_balances_cash",
+    "investments": "fetch_balances_invest",
+    "investment_history": "fetch_balances_invest",
+}
+
+# Modules that must not be pulled in just by importing the CLI
+HEAVY_MODULES = ["requests", "dotenv", "pandas", "numpy"]
+DEFAULT_STARTUP_BUDGET_MS = 250
+
+
+def parse_datasets(value):
+    if not value:
+        return list(DATASETS)
+    selected = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in selected if name not in DATASETS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Unknown dataset(s): {', '.join(unknown)}. Choose from {', '.join(DATASETS)}")
+    return selected
+
+
+def parse_formats(value):
+    selected = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in selected if name not in FORMATS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Unknown format(s): {', '.join(unknown)}. Choose from {', '.join(FORMATS)}")
+    return selected
+
+
+def open_session():
+    """
+    Builds an authorized session from CK_ACCESS_TOKEN and probes it. Returns None if the token is invalid.
+    """
+    import dotenv
+    import requests
+    from src.credit_karma_scraper import graphql_request
+
+    access_token = dotenv.get_key('.env', 'CK_ACCESS_TOKEN')
+
+    print("[LOG] Setting up session with Authorization header...")
+    session = requests.Session()
+    session.headers.update({
+        'Authorization': f'{access_token}',
+        'User-Agent': 'Mozilla/5.0',
+        'Accept': 'application/json',
+    })
+    print(f"[LOG] Session setup complete. Using token: {session.headers['Authorization'][:12]}...{session.headers['Authorization'][-4:]}")
+
+    # Test token validity before proceeding
+    test_payload = {"query": "query { me { id } }"}
+    test_resp = graphql_request(session, test_payload)
+    if not test_resp or test_resp.get("errorCode") == "TOKEN_NEEDS_REFRESH":
+        print("[ERROR] Initial access token is invalid or expired. Please set CK_ACCESS_TOKEN and try again.")
+        return None
+    return session
+
+
+def run_fetch(datasets, data_dir=DATA_DIR):
+    session = open_session()
+    if session is None:
+        return False
+
+    from src import credit_karma_scraper
+
+    done = set()
+    for dataset in datasets:
+        fetcher = FETCHERS[dataset]
+        if fetcher in done:
+            continue
+        getattr(credit_karma_scraper, fetcher)(session, data_dir)
+        done.add(fetcher)
+    return True
+
+
+def run_extract(datasets, data_dir=DATA_DIR, formats=("csv",)):
+    """
+    Runs the selected extractors, then refreshes the derived files that depend on them.
+    `formats` beyond csv add typed columnar copies (see src/columnar.py).
+    """
+    from src import utils
+
+    print(f"Extracting {', '.join(datasets)} to CSV...")
+    loaded = {}
+    combined = "investments" in datasets and "investment_history" in datasets
+    for dataset in DATASETS:
+        if dataset not in datasets:
+            continue
+        if combined and dataset == "investment_history":
+            continue
+        raw_path = os.path.join(data_dir, RAW_FILES[dataset])
+        if not os.path.exists(raw_path):
+            print(f"[ERROR] {raw_path} not found. Run fetch first.")
+            continue
+        # investments and investment_history share one raw file; load it once
+        if raw_path not in loaded:
+            loaded[raw_path] = utils.load_from_json(raw_path)
+        if combined and dataset == "investments":
+            # Balances and history come from one traversal of the same views
+            utils.extract_investments_to_csv(
+                loaded[raw_path],
+                os.path.join(data_dir, EXTRACTORS["investments"][1]),
+                os.path.join(data_dir, EXTRACTORS["investment_history"][1]),
+            )
+            continue
+        extractor, output_csv = EXTRACTORS[dataset]
+        getattr(utils, extractor)(loaded[raw_path], os.path.join(data_dir, output_csv))
+
+    if "transactions" in datasets:
+        from src.search_index import build_search_index_from_csv
+        from src.rollups import update_rollups_from_csv
+
+        transactions_csv = os.path.join(data_dir, "transactions.csv")
+        # Build the search index served by /api/search
+        build_search_index_from_csv(transactions_csv, os.path.join(data_dir, "search_index.json"))
+        # Fold new or changed transactions into the persisted rollup tables
+        update_rollups_from_csv(transactions_csv, os.path.join(data_dir, "rollups.json"))
+
+    if "transactions" in datasets or "cash" in datasets:
+        # Recurring charges and month-end forecast; skipped when the inputs are unchanged
+        from src.recurring import build_recurring_report
+        build_recurring_report(data_dir)
+
+    # Precompute the single-request dashboard bootstrap bundle
+    from src.dashboard_bundle import build_dashboard_bundle
+    build_dashboard_bundle(data_dir)
+
+    # Also refreshes columnar copies carried over from the previous generation
+    from src.columnar import write_columnar
+    write_columnar(datasets, formats, data_dir)
+
+
+def measure_startup(argv=None, cwd=None):
+    """
+    Runs the CLI in a fresh interpreter: `import src.cli` and the parser, then
+    `main(argv)` when a command is given (from `cwd`, so relative Data/ paths
+    resolve there). Returns a report with the wall time including interpreter
+    start, the time spent in the CLI itself, the HEAVY_MODULES loaded by then
+    and the command's exit code.
+    """
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    probe = (
+        "import contextlib, json, sys, time\n"
+        f"sys.path.insert(0, {project_root!r})\n"
+        "start = time.perf_counter()\n"
+        "import src.cli\n"
+        "src.cli.build_parser()\n"
+        "exit_code = 0\n"
+        "if sys.argv[1:]:\n"
+        "    with contextlib.redirect_stdout(sys.stderr):\n"
+        "        exit_code = src.cli.main(sys.argv[1:])\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'cli_ms': elapsed, 'heavy': heavy, 'exit_code': exit_code}))\n"
+    )
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", probe, *(argv or [])], capture_output=True, text=True,
+                            cwd=cwd or project_root)
+    total_ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        return {"total_ms": total_ms, "error": result.stderr.strip()}
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    report["total_ms"] = total_ms
+    return report
+
+
+def _scratch_data_dir(root):
+    """
+    Copies the raw JSON of the current generation into root/Data so a probed
+    command can run without touching the real Data/ directory.
+    """
+    from src.publish import current_data_dir
+
+    source_dir = current_data_dir(DATA_DIR)
+    scratch_dir = os.path.join(root, DATA_DIR)
+    os.makedirs(scratch_dir)
+    for raw_name in sorted(set(RAW_FILES.values())):
+        raw_path = os.path.join(source_dir, raw_name)
+        if os.path.exists(raw_path):
+            shutil.copy2(raw_path, scratch_dir)
+
+
+def check_startup(budget_ms=DEFAULT_STARTUP_BUDGET_MS, argv=None):
+    """
+    Measures a cold CLI start in a fresh interpreter, optionally through a whole
+    command (e.g. `extract --only cards`, run against a scratch copy of the raw
+    files), and fails if it exceeds the budget or drags in any of HEAVY_MODULES.
+    Returns True when within budget.
+    """
+    with tempfile.TemporaryDirectory() as scratch:
+        if argv:
+            _scratch_data_dir(scratch)
+        report = measure_startup(argv, cwd=scratch if argv else None)
+    label = f"`{' '.join(argv)}`" if argv else "CLI import"
+    if "error" in report:
+        print(f"[ERROR] Startup probe failed: {report['error']}")
+        return False
+
+    print(f"[LOG] Interpreter + {label}: {report['total_ms']:.1f} ms (CLI {report['cli_ms']:.1f} ms, budget {budget_ms} ms)")
+    ok = True
+    if report["exit_code"]:
+        print(f"[ERROR] {label} exited with status {report['exit_code']}")
+        ok = False
+    if report["heavy"]:
+        print(f"[ERROR] {label} loaded heavy modules: {', '.join(report['heavy'])}")
+        ok = False
+    if report["total_ms"] > budget_ms:
+        print(f"[ERROR] Startup took {report['total_ms']:.1f} ms, over the {budget_ms} ms budget")
+        ok = False
+    if ok:
+        print("[SUCCESS] Startup within budget")
+    return ok
+
+
+def run_archive(args):
+    from src.archive import RawArchive, export_snapshots
+    from src.utils import atomic_open
+
+    if args.archive_command == "export":
+        export_snapshots(args.output_root, tenant=args.tenant, dataset=args.dataset, since=args.since, until=args.until)
+        return 0
+
+    archive = RawArchive()
+    try:
+        if args.archive_command == "list":
+            for row in archive.snapshots(args.tenant, args.dataset, args.since, args.until, args.limit):
+                print(f"{row['taken_at']}  {row['tenant']:<12} {row['dataset']:<24} {row['root_hash'][:16]}  {row['raw_bytes']:>10} bytes")
+        elif args.archive_command == "stats":
+            for key, value in archive.stats().items():
+                print(f"{key}: {value}")
+        elif args.archive_command == "restore":
+            with atomic_open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(archive.load(args.root_hash), f, indent=2)
+            print(f"[SUCCESS] Restored {args.root_hash[:12]} to {args.output}")
+        elif args.archive_command == "train-dict":
+            archive.train_dictionary(recompress=args.recompress)
+    finally:
+        archive.close()
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="Credit Karma scraper")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    only_help = f"Comma-separated datasets to process ({', '.join(DATASETS)}). Defaults to all."
+    for name, help_text in [
+        ("fetch", "Fetch raw JSON from Credit Karma into Data/"),
+        ("extract", "Extract CSVs (and derived indexes) from the raw JSON in Data/"),
+        ("sync", "Fetch then extract"),
+    ]:
+        command = subparsers.add_parser(name, help=help_text)
+        command.add_argument("--only", type=parse_datasets, default=list(DATASETS), help=only_help)
+        if name != "fetch":
+            command.add_argument("--format", dest="formats", type=parse_formats, default=["csv"],
+                                 help=f"Comma-separated output formats ({', '.join(FORMATS)}). Defaults to csv.")
+
+    subparsers.add_parser("generations", help="List published data generations")
+    subparsers.add_parser("rollback", help="Point Data/current back at the previous generation")
+
+    reextract = subparsers.add_parser("reextract", help="Re-run extractors over archived raw snapshot directories")
+    reextract.add_argument("root", help="Directory tree containing raw *.json snapshots")
+    reextract.add_argument("--out", help="Output root (defaults to writing next to the raw files)")
+    reextract.add_argument("--workers", type=int, default=None, help="Worker processes (defaults to CPU count)")
+    reextract.add_argument("--only", type=parse_datasets, default=list(DATASETS), help=only_help)
+    reextract.add_argument("--force", action="store_true", help="Re-extract even if inputs and extractor versions are unchanged")
+
+    archive = subparsers.add_parser("archive", help="Inspect the content-addressed raw response archive")
+    archive_commands = archive.add_subparsers(dest="archive_command", required=True)
+    archive_list = archive_commands.add_parser("list", help="List archived snapshots, newest first")
+    archive_list.add_argument("--tenant")
+    archive_list.add_argument("--dataset")
+    archive_list.add_argument("--since", help="ISO timestamp lower bound")
+    archive_list.add_argument("--until", help="ISO timestamp upper bound")
+    archive_list.add_argument("--limit", type=int, default=50)
+    archive_commands.add_parser("stats", help="Snapshot count and raw vs stored bytes")
+    archive_restore = archive_commands.add_parser("restore", help="Write one snapshot back out as JSON")
+    archive_restore.add_argument("root_hash")
+    archive_restore.add_argument("output", help="Output JSON path")
+    archive_export = archive_commands.add_parser("export", help="Materialize snapshots as <tenant>/<time>/<dataset>.json for reextract")
+    archive_export.add_argument("output_root")
+    archive_export.add_argument("--tenant")
+    archive_export.add_argument("--dataset")
+    archive_export.add_argument("--since")
+    archive_export.add_argument("--until")
+    archive_train = archive_commands.add_parser("train-dict", help="Train and activate a zstd dictionary on archived blobs")
+    archive_train.add_argument("--recompress", action="store_true", help="Rewrite existing blobs with the new dictionary")
+
+    startup = subparsers.add_parser("check-startup", help="Fail if CLI startup exceeds the time budget")
+    startup.add_argument("--budget-ms", type=float, default=DEFAULT_STARTUP_BUDGET_MS)
+    startup.add_argument("probe", nargs=argparse.REMAINDER,
+                         help="Command to time end to end against a scratch copy of the raw files")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.command == "check-startup":
+        return 0 if check_startup(args.budget_ms, args.probe) else 1
+
+    if args.command == "reextract":
+        from src.batch import reextract
+        summary = reextract(args.root, args.out, args.only, args.workers, args.force)
+        return 1 if summary["outputs_failed"] else 0
+
+    if args.command == "archive":
+        return run_archive(args)
+
+    from src import publish
+
+    if args.command == "generations":
+        current = publish.current_generation(DATA_DIR)
+        for generation in publish.list_generations(DATA_DIR):
+            print(f"{'*' if generation == current else ' '} {generation}")
+        return 0
+
+    if args.command == "rollback":
+        return 0 if publish.rollback_generation(DATA_DIR) else 1
+
+    staging_dir = publish.stage_generation(DATA_DIR)
+    try:
+        if args.command in ("fetch", "sync"):
+            if not run_fetch(args.only, staging_dir):
+                publish.discard_generation(staging_dir)
+                return 1
+        if args.command in ("extract", "sync"):
+            run_extract(args.only, staging_dir, args.formats)
+    except BaseException:
+        publish.discard_generation(staging_dir)
+        raise
+    publish.publish_generation(staging_dir, DATA_DIR)
+    print("Done!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+"""
+Optional typed columnar copies of the extracted CSVs.
+
+    python -m src.cli extract --format csv,parquet,feather
+
+CSV stays the source of truth (every derived file is built from it); the
+columnar copies are written from the fresh CSVs into Data/columnar/:
+
+    columnar/transactions/month=2024-05/part-0.parquet   Hive-partitioned by month
+    columnar/transactions.arrow                          one uncompressed Arrow IPC (Feather v2) file
+    columnar/<dataset>.parquet | <dataset>.arrow         balances and investment history
+
+Amounts are float64 and repeated text columns dictionary encoded. Date
+columns keep the text exactly as in the CSV and gain a typed date32 `day`.
+Arrow files are written uncompressed so readers can memory-map them and use
+the buffers without copying; app.py does this for transactions.
+
+Generations are staged from the previous one, so columnar copies carry over
+into runs that don't ask for them. Whenever a dataset is re-extracted, the
+formats it already has are rewritten along with the requested ones; without
+pyarrow they are removed instead of being left stale. pyarrow is only
+imported when a dataset has or asks for a columnar copy.
+"""
+import csv
+import os
+import shutil
+from datetime import date, datetime
+
+from src.utils import atomic_open, parse_money
+
+COLUMNAR_DIR = "columnar"
+TRANSACTIONS_ARROW = os.path.join(COLUMNAR_DIR, "transactions.arrow")
+UNKNOWN_MONTH = "unknown"
+
+# Column types by name; columns not listed are plain strings
+# ("dictionary" = dictionary<int32, string>)
+TRANSACTION_TYPES = {
+    "date": "dictionary",
+    "day": "date",
+    "amount_value": "float",
+    "status": "dictionary",
+    "account_name": "dictionary",
+    "account_type": "dictionary",
+    "account_provider": "dictionary",
+    "account_display": "dictionary",
+    "category_name": "dictionary",
+    "category_type": "dictionary",
+    "category_id": "dictionary",
+    "merchant_name": "dictionary",
+}
+
+BALANCE_TYPES = {
+    "balance_value": "float",
+    "bank": "dictionary",
+    "broker": "dictionary",
+}
+
+HISTORY_TYPES = {
+    "day": "date",
+    "value_amount": "float",
+    "raw_value": "float",
+    "period": "dictionary",
+    "data_point_index": "int",
+}
+
+# Dataset -> (CSV written by the extractor, column types, derived typed columns)
+TABLES = {
+    "transactions": ("transactions.csv", TRANSACTION_TYPES, {"day": lambda row: _parse_iso_date(row.get("date"))}),
+    "cards": ("card_balances.csv", BALANCE_TYPES, {"balance_value": lambda row: parse_money(row.get("balance"))}),
+    "cash": ("cash_balances.csv", BALANCE_TYPES, {"balance_value": lambda row: parse_money(row.get("balance"))}),
+    "investments": ("investment_balances.csv", BALANCE_TYPES, {"balance_value": lambda row: parse_money(row.get("balance"))}),
+    "investment_history": ("investment_history.csv", HISTORY_TYPES, {
+        "day": lambda row: _parse_label_date(row.get("date")),
+        "value_amount": lambda row: parse_money(row.get("value")),
+    }),
+}
+
+
+def _parse_iso_date(value):
+    try:
+        return date.fromisoformat((value or "")[:10])
+    except ValueError:
+        return None
+
+
+def _parse_label_date(value):
+    """
+    Chart labels look like "Jan 1, 2024".
+    """
+    try:
+        return datetime.strptime((value or "").strip(), "%b %d, %Y").date()
+    except ValueError:
+        return None
+
+
+def _parse_float(value):
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_int(value):
+    number = _parse_float(value)
+    return int(number) if number is not None and number.is_integer() else None
+
+
+def _column(pa, values, kind):
+    if kind == "float":
+        return pa.array([v if isinstance(v, float) else _parse_float(v) for v in values], type=pa.float64())
+    if kind == "int":
+        return pa.array([v if isinstance(v, int) else _parse_int(v) for v in values], type=pa.int64())
+    if kind == "date":
+        return pa.array([v if isinstance(v, date) else _parse_iso_date(v) for v in values], type=pa.date32())
+    strings = pa.array(["" if v is None else v for v in values], type=pa.string())
+    if kind == "dictionary":
+        return strings.dictionary_encode()
+    return strings
+
+
+def rows_to_table(rows, fieldnames, types, derived=None):
+    """
+    Typed pyarrow Table from CSV rows: the CSV columns in order, then any derived columns.
+    """
+    import pyarrow as pa
+
+    derived = derived or {}
+    columns = {}
+    for field in fieldnames:
+        columns[field] = _column(pa, [row.get(field) for row in rows], types.get(field, "string"))
+    for field, compute in derived.items():
+        columns[field] = _column(pa, [compute(row) for row in rows], types.get(field, "string"))
+    return pa.table(columns)
+
+
+def _read_csv(path):
+    with open(path, newline='', encoding='utf-8') as csvfile:
+        reader = csv.DictReader(csvfile)
+        return list(reader), reader.fieldnames or []
+
+
+def _write_table(table, path, file_format):
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    with atomic_open(path, 'wb') as f:
+        if file_format == "parquet":
+            pq.write_table(table, f, compression="zstd")
+        else:
+            # Uncompressed so readers can memory-map the buffers
+            feather.write_feather(table, f, compression="uncompressed")
+
+
+def _write_transaction_partitions(table, rows, partition_root):
+    """
+    One Parquet file per month under month=YYYY-MM/; months no longer present are removed.
+    """
+    import pyarrow as pa
+
+    months = {}
+    for index, row in enumerate(rows):
+        month = (row.get("date") or "")[:7]
+        if _parse_iso_date(row.get("date")) is None:
+            month = UNKNOWN_MONTH
+        months.setdefault(month, []).append(index)
+
+    for month, indices in sorted(months.items()):
+        part = table.take(pa.array(indices, type=pa.int32()))
+        _write_table(part, os.path.join(partition_root, f"month={month}", "part-0.parquet"), "parquet")
+
+    if os.path.isdir(partition_root):
+        for name in os.listdir(partition_root):
+            if name.startswith("month=") and name[len("month="):] not in months:
+                shutil.rmtree(os.path.join(partition_root, name))
+    return len(months)
+
+
+def _columnar_paths(dataset, columnar_dir):
+    """
+    {format: path} of the columnar copies a dataset can have.
+    """
+    stem = os.path.splitext(TABLES[dataset][0])[0]
+    parquet = os.path.join(columnar_dir, stem if dataset == "transactions" else f"{stem}.parquet")
+    return {"parquet": parquet, "feather": os.path.join(columnar_dir, f"{stem}.arrow")}
+
+
+def _remove_columnar(dataset, columnar_dir):
+    for path in _columnar_paths(dataset, columnar_dir).values():
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        elif os.path.exists(path):
+            os.unlink(path)
+
+
+def write_columnar(datasets, formats, data_dir="Data"):
+    """
+    Writes the requested columnar formats for the selected datasets from their CSVs
+    in `data_dir`, and rewrites any columnar copy they already have so it matches
+    the fresh CSV. Returns the number of files written.
+    """
+    requested = {name for name in formats if name != "csv"}
+    columnar_dir = os.path.join(data_dir, COLUMNAR_DIR)
+    plan = {}
+    stale = []
+    for dataset in datasets:
+        if dataset not in TABLES:
+            continue
+        existing = {name for name, path in _columnar_paths(dataset, columnar_dir).items() if os.path.exists(path)}
+        if existing:
+            stale.append(dataset)
+        if requested | existing:
+            plan[dataset] = requested | existing
+    if not plan:
+        return 0
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        if requested:
+            print("[ERROR] Columnar export requires pyarrow (pip install pyarrow)")
+        for dataset in stale:
+            _remove_columnar(dataset, columnar_dir)
+        if stale:
+            print(f"[WARN] Removed columnar copies of {', '.join(stale)}; they can't be refreshed without pyarrow")
+        return 0
+
+    written = 0
+    for dataset, dataset_formats in plan.items():
+        csv_name, types, derived = TABLES[dataset]
+        csv_path = os.path.join(data_dir, csv_name)
+        if not os.path.exists(csv_path):
+            print(f"[ERROR] {csv_path} not found; skipping columnar export of {dataset}")
+            continue
+        try:
+            rows, fieldnames = _read_csv(csv_path)
+            table = rows_to_table(rows, fieldnames, types, derived)
+            stem = os.path.splitext(csv_name)[0]
+            if "parquet" in dataset_formats:
+                if dataset == "transactions":
+                    partitions = _write_transaction_partitions(table, rows, os.path.join(columnar_dir, stem))
+                    print(f"[SUCCESS] Wrote {table.num_rows} {dataset} rows to {partitions} monthly Parquet partitions")
+                    written += partitions
+                else:
+                    _write_table(table, os.path.join(columnar_dir, f"{stem}.parquet"), "parquet")
+                    written += 1
+            if "feather" in dataset_formats:
+                _write_table(table, os.path.join(columnar_dir, f"{stem}.arrow"), "feather")
+                written += 1
+        except Exception as e:
+            print(f"[ERROR] Failed to write columnar {dataset}: {e}")
+            # Better no columnar copy than one that disagrees with the CSV
+            _remove_columnar(dataset, columnar_dir)
+    if written:
+        print(f"[SUCCESS] Wrote {written} columnar files to {columnar_dir}")
+    return written
+
+
+def read_feather(path):
+    """
+    Memory-maps an Arrow IPC file; fixed-width columns reference the mapped pages without copying.
+    """
+    import pyarrow.feather as feather
+
+    return feather.read_table(path, memory_map=True)
+
+
+def read_transactions(data_dir="Data", months=None):
+    """
+    Reads the month-partitioned transactions Parquet dataset, optionally only `months` ("YYYY-MM").
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(
+        os.path.join(data_dir, COLUMNAR_DIR, "transactions"),
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema([("month", pa.string())]), flavor="hive"),
+    )
+    if months:
+        return dataset.to_table(filter=ds.field("month").isin(list(months)))
+    return dataset.to_table()
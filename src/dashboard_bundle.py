@@ -0,0 +1,172 @@
+"""
+Precomputed, gzip-compressed bootstrap bundle for the dashboard.
+
+Bundles balances, the most recent transactions, headline aggregates and a
+downsampled investment history into one versioned payload, so first paint
+needs a single request. The full datasets stay available from the
+per-file endpoints in app.py.
+"""
+import csv
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from src.utils import atomic_open, parse_money
+
+BUNDLE_VERSION = 2
+BUNDLE_FILENAME = "dashboard_bundle.json.gz"
+
+# Files the bundle is derived from; any change to these invalidates it
+SOURCE_FILES = [
+    "card_balances.csv",
+    "cash_balances.csv",
+    "investment_balances.csv",
+    "investment_history.csv",
+    "transactions.csv",
+    "rollups.json",
+]
+
+RECENT_TRANSACTIONS = 100
+HISTORY_POINTS_PER_PERIOD = 120
+MONTHS_OF_AGGREGATES = 12
+TOP_CATEGORIES = 8
+
+
+def _read_csv(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, newline='', encoding='utf-8') as csvfile:
+        return list(csv.DictReader(csvfile))
+
+
+def source_signature(data_dir):
+    """
+    Cheap (size, mtime) fingerprint of the source files, used to decide whether a rebuild is needed.
+    """
+    signature = {}
+    for name in SOURCE_FILES:
+        path = os.path.join(data_dir, name)
+        if os.path.exists(path):
+            stat = os.stat(path)
+            signature[name] = [stat.st_size, stat.st_mtime_ns]
+    return signature
+
+
+def downsample(points, max_points):
+    """
+    Evenly strides through `points`, always keeping the first and last point.
+    """
+    if len(points) <= max_points:
+        return list(points)
+    step = (len(points) - 1) / (max_points - 1)
+    return [points[round(i * step)] for i in range(max_points)]
+
+
+def _downsample_history(history):
+    by_period = {}
+    for row in history:
+        by_period.setdefault(row.get("period", ""), []).append(row)
+    sampled = []
+    for rows in by_period.values():
+        sampled.extend(downsample(rows, HISTORY_POINTS_PER_PERIOD))
+    return sampled
+
+
+def _is_pending_checking(transaction):
+    return (
+        transaction.get("status") == "PENDING"
+        and transaction.get("account_type") == "BANK"
+        and ((transaction.get("account_subtype") or "").lower() == "checking"
+             or "checking" in (transaction.get("account_name") or "").lower())
+    )
+
+
+def _aggregates(cards, cash, investments, transactions, rollups):
+    # Cash balance includes pending checking activity, matching the dashboard's Cash Balance card
+    pending_cash = sum((parse_money(t.get("amount_value")) for t in transactions if _is_pending_checking(t)), 0.0)
+    aggregates = {
+        "credit_card_debt": round(abs(sum(parse_money(c.get("balance")) for c in cards)), 2),
+        "cash_balance": round(sum(parse_money(a.get("balance")) for a in cash) + pending_cash, 2),
+        "pending_cash": round(pending_cash, 2),
+        "investment_balance": round(sum(parse_money(a.get("balance")) for a in investments), 2),
+        "transaction_count": len(transactions),
+    }
+    aggregates["net_worth"] = round(
+        aggregates["cash_balance"] + aggregates["investment_balance"] - aggregates["credit_card_debt"], 2
+    )
+
+    if rollups:
+        months = rollups["tables"]["month"]
+        recent_months = sorted(months)[-MONTHS_OF_AGGREGATES:]
+        aggregates["monthly"] = [{"month": month, **months[month]} for month in recent_months]
+        categories = rollups["tables"]["category"]
+        top = sorted(categories, key=lambda name: categories[name]["expenses"], reverse=True)[:TOP_CATEGORIES]
+        aggregates["top_categories"] = [{"category": name, **categories[name]} for name in top]
+    return aggregates
+
+
+def build_dashboard_bundle(data_dir="Data"):
+    """
+    Builds the bundle from the files in `data_dir` and writes it gzip-compressed
+    to dashboard_bundle.json.gz. Returns the bundle dict.
+    """
+    try:
+        signature = source_signature(data_dir)
+        cards = _read_csv(os.path.join(data_dir, "card_balances.csv"))
+        cash = _read_csv(os.path.join(data_dir, "cash_balances.csv"))
+        investments = _read_csv(os.path.join(data_dir, "investment_balances.csv"))
+        history = _read_csv(os.path.join(data_dir, "investment_history.csv"))
+        transactions = _read_csv(os.path.join(data_dir, "transactions.csv"))
+
+        rollups = None
+        rollups_path = os.path.join(data_dir, "rollups.json")
+        if os.path.exists(rollups_path):
+            with open(rollups_path, 'r', encoding='utf-8') as f:
+                rollups = json.load(f)
+
+        recent = sorted(transactions, key=lambda t: t.get("date", ""), reverse=True)[:RECENT_TRANSACTIONS]
+
+        content = {
+            "balances": {"cards": cards, "cash": cash, "investments": investments},
+            "recent_transactions": recent,
+            "aggregates": _aggregates(cards, cash, investments, transactions, rollups),
+            "investment_history": _downsample_history(history),
+        }
+        # Version is a content hash so identical data always yields the same ETag
+        content_json = json.dumps(content, sort_keys=True, separators=(",", ":"))
+        version = hashlib.sha256(content_json.encode("utf-8")).hexdigest()[:16]
+
+        bundle = {
+            "bundle_version": BUNDLE_VERSION,
+            "version": version,
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "sources": signature,
+            **content,
+        }
+
+        output_path = os.path.join(data_dir, BUNDLE_FILENAME)
+        with atomic_open(output_path, 'wb') as f:
+            f.write(gzip.compress(json.dumps(bundle, separators=(",", ":")).encode("utf-8")))
+
+        print(f"[SUCCESS] Built dashboard bundle {version} to {output_path}")
+        return bundle
+    except Exception as e:
+        print(f"[ERROR] Failed to build dashboard bundle: {e}")
+        return None
+
+
+def load_dashboard_bundle(data_dir="Data"):
+    """
+    Returns (bundle, compressed_bytes) for the bundle on disk, or (None, None) if missing or outdated.
+    """
+    path = os.path.join(data_dir, BUNDLE_FILENAME)
+    if not os.path.exists(path):
+        return None, None
+    with open(path, 'rb') as f:
+        compressed = f.read()
+    bundle = json.loads(gzip.decompress(compressed))
+    if bundle.get("bundle_version") != BUNDLE_VERSION:
+        return None, None
+    return bundle, compressed
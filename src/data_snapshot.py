@@ -0,0 +1,131 @@
+"""
+Immutable per-generation views of Data/ for the API server.
+
+Each DataSnapshot owns the parsed files of one published generation. The
+SnapshotManager polls Data/current in a background thread; when a new
+generation appears it parses and warms a fresh snapshot before swapping it
+in, so requests never wait on a reload and always read one consistent
+generation.
+"""
+import threading
+import time
+from pathlib import Path
+
+from src.dashboard_bundle import BUNDLE_FILENAME, load_dashboard_bundle, source_signature
+from src.publish import current_data_dir, current_generation
+
+
+def _read_bundle(path):
+    bundle, compressed = load_dashboard_bundle(path.parent)
+    if bundle is None:
+        raise FileNotFoundError(f"{path} is missing or was built by an older version")
+    if bundle.get("sources") != source_signature(path.parent):
+        print(f"[WARN] {path} is older than its source files; serving it until the next extraction")
+    return bundle, compressed
+
+
+class DataSnapshot:
+    def __init__(self, data_dir, generation):
+        self.data_dir = Path(data_dir)
+        self.generation = generation
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def load(self, filename, loader):
+        """
+        Parses `filename` with `loader` once and reuses the result. Raises FileNotFoundError if absent.
+        The mtime check only matters for the flat (pre-generation) layout; generations are immutable.
+        """
+        file_path = self.data_dir / filename
+        mtime = file_path.stat().st_mtime
+        cached = self._cache.get(filename)
+        if cached is None or cached[0] != mtime:
+            with self._lock:
+                cached = self._cache.get(filename)
+                if cached is None or cached[0] != mtime:
+                    cached = (mtime, loader(file_path))
+                    self._cache[filename] = cached
+        return cached[1]
+
+    def signature(self, filenames):
+        """
+        "size.mtime" per file ("-" when absent), so file versions are told apart even
+        in the flat layout, where there is no generation id.
+        """
+        parts = []
+        for filename in filenames:
+            try:
+                stat = (self.data_dir / filename).stat()
+                parts.append(f"{stat.st_size}.{stat.st_mtime_ns}")
+            except FileNotFoundError:
+                parts.append("-")
+        return ",".join(parts)
+
+    def dashboard_bundle(self):
+        """
+        (bundle, gzip bytes) as written by extraction. Raises FileNotFoundError if the generation
+        has no usable bundle. Generations are only written by extract/publish, so a bundle older
+        than its sources is served as is rather than rebuilt here.
+        """
+        return self.load(BUNDLE_FILENAME, _read_bundle)
+
+    def warm(self, loaders):
+        """
+        Eagerly parses every (filename, loader) pair that exists in this generation.
+        """
+        for filename, loader in loaders:
+            if (self.data_dir / filename).exists():
+                try:
+                    self.load(filename, loader)
+                except Exception as e:
+                    print(f"[ERROR] Failed to load {filename} from generation {self.generation}: {e}")
+        try:
+            self.dashboard_bundle()
+        except Exception as e:
+            print(f"[ERROR] Failed to load dashboard bundle for generation {self.generation}: {e}")
+
+
+class SnapshotManager:
+    def __init__(self, data_root, loaders=(), poll_interval=2.0):
+        self.data_root = Path(data_root)
+        self.loaders = list(loaders)
+        self.poll_interval = poll_interval
+        self._snapshot = None
+        self._swap_lock = threading.Lock()
+        self._thread = None
+
+    def current(self):
+        """
+        The snapshot requests should read from; grab it once per request.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.refresh()
+        return snapshot
+
+    def refresh(self):
+        """
+        Swaps in a warmed snapshot if Data/current points at a new generation.
+        """
+        with self._swap_lock:
+            generation = current_generation(self.data_root)
+            if self._snapshot is not None and self._snapshot.generation == generation:
+                return self._snapshot
+            snapshot = DataSnapshot(current_data_dir(self.data_root), generation)
+            snapshot.warm(self.loaders)
+            self._snapshot = snapshot
+            print(f"[LOG] Serving data generation {generation or '(flat Data/ layout)'}")
+            return snapshot
+
+    def _watch(self):
+        while True:
+            time.sleep(self.poll_interval)
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"[ERROR] Failed to reload data generation: {e}")
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._watch, name="data-snapshot-watcher", daemon=True)
+            self._thread.start()
@@ -0,0 +1,138 @@
+"""
+Versioned, atomically published generations of the Data/ directory.
+
+Writers never touch the files readers are using. A run stages a complete
+copy of the current generation, writes into it, and publishes it by renaming
+the staging directory into Data/generations/ and atomically swapping the
+Data/current symlink. Readers resolve Data/current once and see either the
+old or the new generation, never a half-written file.
+
+    Data/
+      current -> generations/20261018T101500123456
+      generations/
+        20261017T090000000000/
+        20261018T101500123456/
+"""
+import os
+import shutil
+from datetime import datetime
+
+GENERATIONS_DIR = "generations"
+CURRENT_LINK = "current"
+STAGING_PREFIX = ".staging-"
+KEEP_GENERATIONS = 5
+
+
+def _generations_root(data_dir):
+    return os.path.join(data_dir, GENERATIONS_DIR)
+
+
+def list_generations(data_dir="Data"):
+    """
+    Published generation ids, oldest first.
+    """
+    root = _generations_root(data_dir)
+    if not os.path.isdir(root):
+        return []
+    return sorted(name for name in os.listdir(root) if not name.startswith("."))
+
+
+def current_generation(data_dir="Data"):
+    """
+    Id of the published generation, or None when Data/ still uses the flat layout.
+    """
+    link = os.path.join(data_dir, CURRENT_LINK)
+    if not os.path.islink(link):
+        return None
+    return os.path.basename(os.readlink(link))
+
+
+def current_data_dir(data_dir="Data"):
+    """
+    Directory readers should use: the current generation, falling back to the flat Data/ layout.
+    """
+    generation = current_generation(data_dir)
+    if generation is None:
+        return data_dir
+    return os.path.join(_generations_root(data_dir), generation)
+
+
+def _link_or_copy(source, destination):
+    # Writers replace files rather than rewriting them in place, so sharing inodes
+    # with the previous generation is safe
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def stage_generation(data_dir="Data"):
+    """
+    Creates a staging directory seeded with the current generation's files
+    (or the flat Data/*.json / *.csv files on first use) and returns its path.
+    """
+    root = _generations_root(data_dir)
+    os.makedirs(root, exist_ok=True)
+    generation_id = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+    staging_dir = os.path.join(root, STAGING_PREFIX + generation_id)
+    os.makedirs(staging_dir)
+
+    source_dir = current_data_dir(data_dir)
+    for name in os.listdir(source_dir):
+        source = os.path.join(source_dir, name)
+        if os.path.isfile(source) and not os.path.islink(source) and not name.startswith("."):
+            _link_or_copy(source, os.path.join(staging_dir, name))
+        elif os.path.isdir(source) and not os.path.islink(source) and not name.startswith(".") \
+                and os.path.realpath(source_dir) != os.path.realpath(data_dir):
+            # Subdirectories (e.g. columnar/) only come from real generations; the flat
+            # layout's directories are generations/ and archive/ themselves
+            shutil.copytree(source, os.path.join(staging_dir, name), copy_function=_link_or_copy)
+
+    print(f"[LOG] Staging generation {generation_id} in {staging_dir}")
+    return staging_dir
+
+
+def _point_current_at(data_dir, generation_id):
+    link = os.path.join(data_dir, CURRENT_LINK)
+    temp_link = os.path.join(data_dir, f".{CURRENT_LINK}-{os.getpid()}")
+    if os.path.lexists(temp_link):
+        os.unlink(temp_link)
+    os.symlink(os.path.join(GENERATIONS_DIR, generation_id), temp_link)
+    os.replace(temp_link, link)
+
+
+def publish_generation(staging_dir, data_dir="Data", keep=KEEP_GENERATIONS):
+    """
+    Atomically publishes a staged generation and prunes all but the newest `keep` generations.
+    """
+    generation_id = os.path.basename(staging_dir)[len(STAGING_PREFIX):]
+    final_dir = os.path.join(_generations_root(data_dir), generation_id)
+    os.rename(staging_dir, final_dir)
+    _point_current_at(data_dir, generation_id)
+    print(f"[SUCCESS] Published generation {generation_id}")
+
+    current = generation_id
+    for old in list_generations(data_dir)[:-keep]:
+        if old != current:
+            shutil.rmtree(os.path.join(_generations_root(data_dir), old), ignore_errors=True)
+    return generation_id
+
+
+def discard_generation(staging_dir):
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    print(f"[LOG] Discarded staged generation {staging_dir}")
+
+
+def rollback_generation(data_dir="Data"):
+    """
+    Points Data/current at the generation published before the current one. Returns its id, or None.
+    """
+    generations = list_generations(data_dir)
+    current = current_generation(data_dir)
+    if current not in generations or generations.index(current) == 0:
+        print("[ERROR] No earlier generation to roll back to")
+        return None
+    previous = generations[generations.index(current) - 1]
+    _point_current_at(data_dir, previous)
+    print(f"[SUCCESS] Rolled back from {current} to {previous}")
+    return previous
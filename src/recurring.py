@@ -0,0 +1,310 @@
+"""
+Recurring charge / subscription detection and month-end cash flow forecast.
+
+Transactions are grouped by normalized merchant and amount band; the day
+intervals inside every group are analysed at once with NumPy to find weekly,
+biweekly, monthly, quarterly and annual series. Results are written to
+recurring.json after extraction and recomputed only when the transaction
+or cash data changes.
+"""
+import calendar
+import csv
+import hashlib
+import json
+import math
+import os
+import re
+from datetime import date, timedelta
+
+from src.utils import atomic_open, parse_money
+
+RECURRING_VERSION = 2
+
+# Period name -> (days, tolerance in days, minimum occurrences)
+PERIODS = {
+    "weekly": (7.0, 1.5, 4),
+    "biweekly": (14.0, 2.0, 3),
+    "monthly": (30.44, 4.0, 3),
+    "quarterly": (91.31, 10.0, 2),
+    "annual": (365.25, 15.0, 2),
+}
+
+# Periods billed on a calendar day: the next charge keeps the day of month
+# (clamped to the month end) instead of adding a fixed number of days
+CALENDAR_MONTHS = {"monthly": 1, "quarterly": 3, "annual": 12}
+
+# Width of an amount band as a ratio: charges within ~15% of each other group together
+AMOUNT_BAND_RATIO = 1.15
+MIN_REGULARITY = 0.6
+
+_STORE_NUMBER_RE = re.compile(r"[#*]?\d+")
+_NON_WORD_RE = re.compile(r"[^a-z ]+")
+_SUFFIXES = {"inc", "llc", "ltd", "co", "com", "corp", "www", "the"}
+
+
+def normalize_merchant(name):
+    """
+    "NETFLIX.COM 866-579-7172" / "Netflix, Inc." -> "netflix"
+    """
+    text = _STORE_NUMBER_RE.sub(" ", (name or "").lower())
+    text = _NON_WORD_RE.sub(" ", text)
+    words = [word for word in text.split() if word not in _SUFFIXES]
+    return " ".join(words)
+
+
+def amount_band(amount):
+    """
+    Signed logarithmic bucket of an amount, so $9.99 and $10.49 share a band.
+    """
+    if amount == 0:
+        return 0
+    band = int(math.floor(math.log(abs(amount)) / math.log(AMOUNT_BAND_RATIO))) + 1
+    return band if amount > 0 else -band
+
+
+def add_months(day, months):
+    """
+    Same day of month `months` later, clamped to the last day of a shorter month.
+    """
+    month_index = day.year * 12 + day.month - 1 + months
+    year, month = divmod(month_index, 12)
+    month += 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def charge_date(last, period, steps=1):
+    """
+    Date of the charge `steps` periods after `last`.
+    """
+    if period in CALENDAR_MONTHS:
+        return add_months(last, CALENDAR_MONTHS[period] * steps)
+    return last + timedelta(days=round(PERIODS[period][0]) * steps)
+
+
+def _parse_day(value):
+    try:
+        return date.fromisoformat(value[:10]).toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+def detect_recurring(transactions, as_of=None):
+    """
+    Returns a list of recurring series found in transaction rows (as written to transactions.csv).
+    `as_of` (a date) defaults to the latest transaction date.
+    """
+    import numpy as np
+
+    keys, days, amounts, names = [], [], [], []
+    for transaction in transactions:
+        day = _parse_day(transaction.get("date", ""))
+        try:
+            amount = float(transaction.get("amount_value") or "nan")
+        except ValueError:
+            continue
+        merchant = transaction.get("merchant_name") or transaction.get("description") or ""
+        normalized = normalize_merchant(merchant)
+        if day is None or math.isnan(amount) or amount == 0 or not normalized:
+            continue
+        keys.append(f"{normalized}|{amount_band(amount)}")
+        days.append(day)
+        amounts.append(amount)
+        names.append(merchant)
+
+    if not keys:
+        return []
+
+    group_keys, group = np.unique(np.array(keys), return_inverse=True)
+    days = np.array(days, dtype=np.int64)
+    amounts = np.array(amounts, dtype=np.float64)
+    as_of_day = as_of.toordinal() if as_of else int(days.max())
+
+    # Order rows by (group, day); rows of a group are then contiguous
+    order = np.lexsort((days, group))
+    group, days, amounts = group[order], days[order], amounts[order]
+    names = [names[i] for i in order]
+
+    counts = np.bincount(group, minlength=len(group_keys))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    ends = starts + counts - 1
+
+    # Intervals between consecutive charges of the same group
+    same_group = group[1:] == group[:-1]
+    intervals = np.diff(days)[same_group]
+    interval_group = group[1:][same_group]
+    interval_counts = np.bincount(interval_group, minlength=len(group_keys))
+
+    # Per-group median interval: sort intervals within each group and pick the middle one
+    interval_order = np.lexsort((intervals, interval_group))
+    sorted_intervals = intervals[interval_order]
+    interval_starts = np.concatenate(([0], np.cumsum(interval_counts)[:-1]))
+    has_intervals = interval_counts > 0
+    median = np.zeros(len(group_keys))
+    lower_mid = interval_starts[has_intervals] + (interval_counts[has_intervals] - 1) // 2
+    upper_mid = interval_starts[has_intervals] + interval_counts[has_intervals] // 2
+    median[has_intervals] = (sorted_intervals[lower_mid] + sorted_intervals[upper_mid]) / 2
+
+    # Snap each group's median interval to the nearest known period within tolerance
+    period_names = list(PERIODS)
+    period_days = np.array([PERIODS[name][0] for name in period_names])
+    period_tolerance = np.array([PERIODS[name][1] for name in period_names])
+    period_min_count = np.array([PERIODS[name][2] for name in period_names])
+    distance = np.abs(median[:, None] - period_days[None, :])
+    nearest = distance.argmin(axis=1)
+    matched = has_intervals & (distance[np.arange(len(group_keys)), nearest] <= period_tolerance[nearest])
+
+    # Regularity: share of a group's intervals that fall within tolerance of its period
+    on_period = np.abs(intervals - period_days[nearest[interval_group]]) <= period_tolerance[nearest[interval_group]]
+    regular = np.bincount(interval_group, weights=on_period, minlength=len(group_keys))
+    regularity = np.divide(regular, interval_counts, out=np.zeros(len(group_keys)), where=has_intervals)
+
+    amount_sum = np.bincount(group, weights=amounts, minlength=len(group_keys))
+    mean_amount = amount_sum / np.maximum(counts, 1)
+    last_day = days[ends]
+    # A series is active if it hasn't missed more than one expected charge
+    active = (as_of_day - last_day) <= 2 * period_days[nearest] + period_tolerance[nearest]
+
+    recurring = matched & (counts >= period_min_count[nearest]) & (regularity >= MIN_REGULARITY)
+
+    series = []
+    for g in np.flatnonzero(recurring):
+        period = period_names[nearest[g]]
+        last_date = date.fromordinal(int(last_day[g]))
+        series.append({
+            "merchant": names[ends[g]],
+            "merchant_key": str(group_keys[g]).split("|")[0],
+            "period": period,
+            "interval_days": float(median[g]),
+            "occurrences": int(counts[g]),
+            "regularity": round(float(regularity[g]), 3),
+            "average_amount": round(float(mean_amount[g]), 2),
+            "last_amount": round(float(amounts[ends[g]]), 2),
+            "first_date": date.fromordinal(int(days[starts[g]])).isoformat(),
+            "last_date": last_date.isoformat(),
+            "next_date": charge_date(last_date, period).isoformat(),
+            "active": bool(active[g]),
+            "annualized_amount": round(float(mean_amount[g]) * 365.25 / period_days[nearest[g]], 2),
+        })
+    series.sort(key=lambda s: (not s["active"], s["annualized_amount"]))
+    return series
+
+
+def forecast_month_end(transactions, series, as_of=None, cash_balance=None):
+    """
+    Projects the rest of the current month: month-to-date net from actual transactions
+    plus every charge the active recurring series are expected to make before month end.
+    """
+    days = [d for d in (_parse_day(t.get("date", "")) for t in transactions) if d is not None]
+    if not days:
+        return None
+    as_of = as_of or date.fromordinal(max(days))
+    month_end = date(as_of.year, as_of.month, calendar.monthrange(as_of.year, as_of.month)[1])
+    month_prefix = as_of.isoformat()[:7]
+
+    month_to_date = 0.0
+    for transaction in transactions:
+        if transaction.get("date", "").startswith(month_prefix):
+            try:
+                month_to_date += float(transaction.get("amount_value") or 0)
+            except ValueError:
+                pass
+
+    upcoming = []
+    for s in series:
+        if not s["active"]:
+            continue
+        last_date = date.fromisoformat(s["last_date"])
+        steps = 1
+        charge = charge_date(last_date, s["period"], steps)
+        expected = []
+        if charge <= as_of:
+            # An overdue charge is expected on the next day; later ones keep their schedule
+            expected.append(as_of + timedelta(days=1))
+            while charge <= as_of:
+                steps += 1
+                charge = charge_date(last_date, s["period"], steps)
+        while charge <= month_end:
+            expected.append(charge)
+            steps += 1
+            charge = charge_date(last_date, s["period"], steps)
+        for day in expected:
+            if day <= month_end:
+                upcoming.append({"date": day.isoformat(), "merchant": s["merchant"],
+                                 "amount": s["average_amount"], "period": s["period"]})
+    upcoming.sort(key=lambda charge: charge["date"])
+
+    expected_income = round(sum(c["amount"] for c in upcoming if c["amount"] > 0), 2)
+    expected_expenses = round(sum(-c["amount"] for c in upcoming if c["amount"] < 0), 2)
+    forecast = {
+        "as_of": as_of.isoformat(),
+        "month_end": month_end.isoformat(),
+        "month_to_date_net": round(month_to_date, 2),
+        "expected_recurring_income": expected_income,
+        "expected_recurring_expenses": expected_expenses,
+        "projected_month_net": round(month_to_date + expected_income - expected_expenses, 2),
+        "upcoming": upcoming,
+    }
+    if cash_balance is not None:
+        forecast["cash_balance"] = round(cash_balance, 2)
+        forecast["projected_month_end_cash"] = round(cash_balance + expected_income - expected_expenses, 2)
+    return forecast
+
+
+def _data_version(paths):
+    digest = hashlib.sha256(f"recurring-v{RECURRING_VERSION}".encode("utf-8"))
+    for path in paths:
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def load_recurring(recurring_json="Data/recurring.json"):
+    with open(recurring_json, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def build_recurring_report(data_dir="Data"):
+    """
+    Writes recurring.json (series + month-end forecast) for the data in `data_dir`,
+    skipping the work when transactions.csv and cash_balances.csv are unchanged.
+    """
+    transactions_csv = os.path.join(data_dir, "transactions.csv")
+    cash_csv = os.path.join(data_dir, "cash_balances.csv")
+    output_json = os.path.join(data_dir, "recurring.json")
+    try:
+        if not os.path.exists(transactions_csv):
+            print(f"[ERROR] {transactions_csv} not found; skipping recurring charge detection")
+            return None
+
+        data_version = _data_version([transactions_csv, cash_csv])
+        if os.path.exists(output_json):
+            existing = load_recurring(output_json)
+            if existing.get("data_version") == data_version:
+                print(f"[LOG] Recurring charges already up to date ({data_version})")
+                return existing
+
+        with open(transactions_csv, newline='', encoding='utf-8') as csvfile:
+            transactions = list(csv.DictReader(csvfile))
+
+        cash_balance = None
+        if os.path.exists(cash_csv):
+            with open(cash_csv, newline='', encoding='utf-8') as csvfile:
+                cash_balance = sum(parse_money(row.get("balance")) for row in csv.DictReader(csvfile))
+
+        series = detect_recurring(transactions)
+        report = {
+            "version": RECURRING_VERSION,
+            "data_version": data_version,
+            "series": series,
+            "forecast": forecast_month_end(transactions, series, cash_balance=cash_balance),
+        }
+        with atomic_open(output_json, 'w', encoding='utf-8') as f:
+            json.dump(report, f)
+
+        active = sum(1 for s in series if s["active"])
+        print(f"[SUCCESS] Detected {len(series)} recurring series ({active} active) to {output_json}")
+        return report
+    except Exception as e:
+        print(f"[ERROR] Failed to detect recurring charges: {e}")
+        return None
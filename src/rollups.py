@@ -0,0 +1,163 @@
+"""
+Incrementally maintained rollup tables over extracted transactions.
+
+Each sync compares the fresh transactions.csv against the per-transaction
+contributions recorded in rollups.json and only adjusts the day, month,
+category, account and merchant buckets touched by new, changed or removed
+transactions.
+"""
+import csv
+import json
+import os
+
+from src.utils import atomic_open
+
+ROLLUPS_VERSION = 1
+
+# Rollup dimension -> position of its bucket key in a contribution record
+DIMENSIONS = {
+    "day": 0,
+    "month": 1,
+    "category": 2,
+    "account": 3,
+    "merchant": 4,
+}
+_AMOUNT = 5
+
+
+def empty_rollups():
+    return {
+        "version": ROLLUPS_VERSION,
+        "contributions": {},
+        "tables": {dimension: {} for dimension in DIMENSIONS},
+    }
+
+
+def _transaction_key(transaction, occurrences):
+    """
+    Stable key for a transaction's contribution. Rows sharing a base key (identical
+    id-less purchases on the same day) are told apart by their occurrence index;
+    `occurrences` counts base keys seen so far in this pass.
+    """
+    key = transaction.get("transaction_id", "")
+    if not key:
+        # Fall back to the identifying fields when the API omits an id
+        key = "|".join([
+            transaction.get("date", ""),
+            transaction.get("description", ""),
+            transaction.get("amount_value", ""),
+            transaction.get("account_name", ""),
+        ])
+    occurrence = occurrences.get(key, 0)
+    occurrences[key] = occurrence + 1
+    # The first occurrence keeps the bare key so existing rollups.json files stay valid
+    return key if occurrence == 0 else f"{key}#{occurrence}"
+
+
+def _contribution(transaction):
+    """
+    The bucket keys and amount a transaction adds to the rollups, as stored in rollups.json.
+    """
+    date = transaction.get("date", "")
+    try:
+        amount = float(transaction.get("amount_value") or 0)
+    except ValueError:
+        amount = 0.0
+    return [
+        date,
+        date[:7],
+        transaction.get("category_name") or "Other",
+        transaction.get("account_name") or "Unknown",
+        transaction.get("merchant_name") or transaction.get("description") or "Unknown",
+        amount,
+    ]
+
+
+def _apply(tables, contribution, sign):
+    amount = contribution[_AMOUNT]
+    for dimension, position in DIMENSIONS.items():
+        key = contribution[position]
+        if not key:
+            continue
+        bucket = tables[dimension].setdefault(key, {"sum": 0.0, "count": 0, "income": 0.0, "expenses": 0.0})
+        bucket["sum"] = round(bucket["sum"] + sign * amount, 2)
+        bucket["count"] += sign
+        if amount > 0:
+            bucket["income"] = round(bucket["income"] + sign * amount, 2)
+        elif amount < 0:
+            bucket["expenses"] = round(bucket["expenses"] + sign * abs(amount), 2)
+        if bucket["count"] <= 0:
+            del tables[dimension][key]
+
+
+def update_rollups(rollups, transactions):
+    """
+    Applies the difference between the recorded contributions and `transactions`
+    to the rollup tables in place. Returns (added, changed, removed) counts.
+    """
+    contributions = rollups["contributions"]
+    tables = rollups["tables"]
+    added = changed = 0
+
+    seen = set()
+    occurrences = {}
+    for transaction in transactions:
+        key = _transaction_key(transaction, occurrences)
+        seen.add(key)
+        new = _contribution(transaction)
+        old = contributions.get(key)
+        if old == new:
+            continue
+        if old is None:
+            added += 1
+        else:
+            changed += 1
+            _apply(tables, old, -1)
+        _apply(tables, new, 1)
+        contributions[key] = new
+
+    removed_keys = [key for key in contributions if key not in seen]
+    for key in removed_keys:
+        _apply(tables, contributions.pop(key), -1)
+
+    return added, changed, len(removed_keys)
+
+
+def load_rollups(rollups_json="Data/rollups.json"):
+    if not os.path.exists(rollups_json):
+        return empty_rollups()
+    with open(rollups_json, 'r', encoding='utf-8') as f:
+        rollups = json.load(f)
+    if rollups.get("version") != ROLLUPS_VERSION:
+        # Layout changed; rebuild from scratch on this sync
+        return empty_rollups()
+    return rollups
+
+
+def update_rollups_from_csv(transactions_csv="Data/transactions.csv", rollups_json="Data/rollups.json"):
+    """
+    Applies the changes found in transactions.csv to the rollups stored in rollups_json.
+    """
+    try:
+        with open(transactions_csv, newline='', encoding='utf-8') as csvfile:
+            transactions = list(csv.DictReader(csvfile))
+
+        rollups = load_rollups(rollups_json)
+        added, changed, removed = update_rollups(rollups, transactions)
+
+        with atomic_open(rollups_json, 'w', encoding='utf-8') as f:
+            json.dump(rollups, f)
+
+        print(f"[SUCCESS] Updated rollups in {rollups_json}: {added} new, {changed} changed, {removed} removed transactions")
+        return rollups
+    except Exception as e:
+        print(f"[ERROR] Failed to update rollups: {e}")
+        return None
+
+
+def rollup_rows(rollups, dimension):
+    """
+    Flattens one rollup table into a list of rows sorted by bucket key.
+    """
+    table = rollups["tables"][dimension]
+    return [{"key": key, **table[key]} for key in sorted(table)]
@@ -0,0 +1,404 @@
+"""
+Inverted + trigram search index over extracted transactions.
+
+Built once by the extraction step from transactions.csv and served by
+app.py's /api/search endpoint, so typing-time search only touches the
+postings of the query terms instead of scanning every row. On load,
+postings and per-row facet codes become NumPy arrays; scoring, facet
+counts and picking the requested page are then vectorized, so a query
+matching most rows doesn't cost a Python-level pass per hit.
+
+The index keeps no copy of the rows, only their positions in transactions.csv;
+results are materialized from the shared TransactionTable of the same generation.
+"""
+import csv
+import json
+import math
+import re
+from bisect import bisect_left
+
+from src.transaction_table import MISSING_DAY, day_ordinal
+from src.utils import atomic_open
+
+INDEX_VERSION = 3
+
+# Fields that are tokenized into the inverted index, with their ranking weight
+SEARCH_FIELDS = {
+    "merchant_name": 1.5,
+    "description": 1.0,
+    "category_name": 0.8,
+    "account_name": 0.5,
+}
+
+# Low-cardinality fields exposed as facets (the dashboard filter dropdowns)
+FACET_FIELDS = ["account_name", "account_type", "category_name", "status"]
+
+# Amount sign filter -> sign of amount_value
+AMOUNT_SIGNS = {"income": 1, "expense": -1}
+
+PREFIX_EXPANSION_LIMIT = 50
+# Low enough that a single dropped or swapped letter still matches ("amzon" ~ "amazon" is 0.375)
+FUZZY_MIN_SIMILARITY = 0.3
+FUZZY_EXPANSION_LIMIT = 10
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def trigrams(term):
+    padded = f"${term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def build_search_index(transactions):
+    """
+    Builds the search index from a list of transaction rows (as written to transactions.csv).
+    Docs are numbered newest first so doc ids double as the default sort order;
+    `rows` maps each doc id back to its row in `transactions`.
+    """
+    rows = sorted(range(len(transactions)), key=lambda row: transactions[row].get("date", ""), reverse=True)
+    docs = [transactions[row] for row in rows]
+
+    postings = {}
+    facet_values = {field: [] for field in FACET_FIELDS}
+    facet_lookup = {field: {} for field in FACET_FIELDS}
+    facet_codes = {field: [] for field in FACET_FIELDS}
+
+    for doc_id, doc in enumerate(docs):
+        term_weights = {}
+        for field, weight in SEARCH_FIELDS.items():
+            for term in set(tokenize(doc.get(field, ""))):
+                term_weights[term] = term_weights.get(term, 0) + weight
+        for term, weight in term_weights.items():
+            postings.setdefault(term, []).append([doc_id, weight])
+
+        # One code per doc and facet field (-1 = empty), so counts over any hit set are a bincount
+        for field in FACET_FIELDS:
+            value = doc.get(field, "")
+            code = -1
+            if value:
+                code = facet_lookup[field].get(value)
+                if code is None:
+                    code = len(facet_values[field])
+                    facet_lookup[field][value] = code
+                    facet_values[field].append(value)
+            facet_codes[field].append(code)
+
+    vocabulary = sorted(postings)
+    trigram_index = {}
+    for term_id, term in enumerate(vocabulary):
+        for gram in trigrams(term):
+            trigram_index.setdefault(gram, []).append(term_id)
+
+    return {
+        "version": INDEX_VERSION,
+        "doc_count": len(docs),
+        "rows": rows,
+        "vocabulary": vocabulary,
+        "postings": postings,
+        "trigrams": trigram_index,
+        "facet_values": facet_values,
+        "facet_codes": facet_codes,
+    }
+
+
+def build_search_index_from_csv(transactions_csv="Data/transactions.csv", output_json="Data/search_index.json"):
+    """
+    Reads transactions.csv and writes the search index next to it.
+    """
+    try:
+        with open(transactions_csv, newline='', encoding='utf-8') as csvfile:
+            transactions = list(csv.DictReader(csvfile))
+
+        index = build_search_index(transactions)
+        with atomic_open(output_json, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+
+        print(f"[SUCCESS] Indexed {index['doc_count']} transactions ({len(index['vocabulary'])} terms) to {output_json}")
+        return index
+    except Exception as e:
+        print(f"[ERROR] Failed to build search index: {e}")
+        return None
+
+
+def prepare_search_index(index):
+    """
+    Converts a freshly built or loaded index to its query form: postings become
+    (doc ids, weights) arrays and row ids and facet codes int32 arrays, with
+    unfiltered facet counts precomputed.
+    """
+    import numpy as np
+
+    index["rows"] = np.array(index["rows"], dtype=np.int32)
+    index["postings"] = {
+        term: (np.array([p[0] for p in entries], dtype=np.int32), np.array([p[1] for p in entries], dtype=np.float64))
+        for term, entries in index["postings"].items()
+    }
+    index["facet_codes"] = {field: np.array(codes, dtype=np.int32) for field, codes in index["facet_codes"].items()}
+    index["facet_lookup"] = {field: {value: code for code, value in enumerate(values)}
+                             for field, values in index["facet_values"].items()}
+    index["facet_totals"] = _facet_counts(index, None)
+    return index
+
+
+def load_search_index(index_json="Data/search_index.json"):
+    with open(index_json, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    if index.get("version") != INDEX_VERSION:
+        raise ValueError(f"Unsupported search index version {index.get('version')}; re-run extract")
+    return prepare_search_index(index)
+
+
+def _expand_term(index, term, allow_prefix, allow_fuzzy):
+    """
+    Returns {vocabulary_term: match_factor} for a single query term.
+    """
+    vocabulary = index["vocabulary"]
+    matches = {}
+    if term in index["postings"]:
+        matches[term] = 1.0
+
+    if allow_prefix:
+        start = bisect_left(vocabulary, term)
+        for candidate in vocabulary[start:start + PREFIX_EXPANSION_LIMIT]:
+            if not candidate.startswith(term):
+                break
+            matches.setdefault(candidate, 0.9)
+
+    if allow_fuzzy and len(term) >= 3:
+        query_grams = trigrams(term)
+        shared = {}
+        for gram in query_grams:
+            for term_id in index["trigrams"].get(gram, []):
+                shared[term_id] = shared.get(term_id, 0) + 1
+        scored = []
+        for term_id, count in shared.items():
+            candidate = vocabulary[term_id]
+            similarity = count / (len(query_grams) + len(trigrams(candidate)) - count)
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                scored.append((similarity, candidate))
+        scored.sort(reverse=True)
+        for similarity, candidate in scored[:FUZZY_EXPANSION_LIMIT]:
+            matches.setdefault(candidate, 0.8 * similarity)
+
+    return matches
+
+
+def _facet_mask(index, field, values, doc_ids):
+    """
+    Boolean mask over `doc_ids` (every doc when None) of docs whose `field` is one of `values`.
+    """
+    import numpy as np
+
+    lookup = index["facet_lookup"][field]
+    codes = index["facet_codes"][field]
+    if doc_ids is not None:
+        codes = codes[doc_ids]
+    return np.isin(codes, np.array([lookup[value] for value in values if value in lookup], dtype=np.int32))
+
+
+def _row_mask(index, table, doc_ids, start_date, end_date, amount_sign):
+    """
+    Date range and amount sign mask over `doc_ids`, read from the table's typed
+    columns. Returns None when neither filter is set.
+    """
+    import numpy as np
+
+    if not (start_date or end_date or amount_sign):
+        return None
+    rows = index["rows"] if doc_ids is None else index["rows"][doc_ids]
+    mask = np.ones(len(rows), dtype=bool)
+    if start_date or end_date:
+        day = np.asarray(table.day)[rows]
+        mask &= day != MISSING_DAY
+        if start_date:
+            mask &= day >= day_ordinal(start_date)
+        if end_date:
+            mask &= day <= day_ordinal(end_date)
+    if amount_sign:
+        amount = np.asarray(table.amount)[rows]
+        mask &= amount > 0 if AMOUNT_SIGNS[amount_sign] > 0 else amount < 0
+    return mask
+
+
+def _apply_filters(index, table, doc_ids, filters, start_date, end_date, amount_sign):
+    """
+    Filters `doc_ids` (every doc when None). Returns (mask over them or None when
+    nothing is filtered, facet counts). Each facet field is counted under every
+    filter except its own, so a dropdown keeps offering the values it can switch to.
+    """
+    import numpy as np
+
+    facet_masks = {
+        field: _facet_mask(index, field, values, doc_ids)
+        for field, values in (filters or {}).items()
+        if field in index["facet_codes"] and values
+    }
+    row_mask = _row_mask(index, table, doc_ids, start_date, end_date, amount_sign)
+    if not facet_masks and row_mask is None:
+        return None, index["facet_totals"] if doc_ids is None else _facet_counts(index, doc_ids)
+
+    candidates = np.arange(index["doc_count"], dtype=np.int32) if doc_ids is None else doc_ids
+    base = np.ones(len(candidates), dtype=bool) if row_mask is None else row_mask
+    keep = base.copy()
+    for mask in facet_masks.values():
+        keep &= mask
+
+    facets = _facet_counts(index, candidates[keep], [field for field in index["facet_codes"] if field not in facet_masks])
+    for field in facet_masks:
+        mask = base.copy()
+        for other, other_mask in facet_masks.items():
+            if other != field:
+                mask &= other_mask
+        facets.update(_facet_counts(index, candidates[mask], [field]))
+    return keep, facets
+
+
+def _facet_counts(index, doc_ids, fields=None):
+    """
+    {field: {value: count}} over `doc_ids` (an int array), or over every doc when None.
+    """
+    import numpy as np
+
+    counts = {}
+    for field in (index["facet_codes"] if fields is None else fields):
+        codes = index["facet_codes"][field]
+        values = index["facet_values"][field]
+        if doc_ids is not None:
+            codes = codes[doc_ids]
+        tally = np.bincount(codes[codes >= 0], minlength=len(values))
+        counts[field] = {values[code]: int(tally[code]) for code in np.flatnonzero(tally)}
+    return counts
+
+
+def _term_scores(index, expansions):
+    """
+    Doc ids (ascending) containing any expansion of one query term, each scored by its best expansion.
+    """
+    import numpy as np
+
+    doc_count = index["doc_count"]
+    id_parts, score_parts = [], []
+    for candidate, factor in expansions.items():
+        doc_ids, weights = index["postings"][candidate]
+        idf = math.log(1 + doc_count / len(doc_ids))
+        id_parts.append(doc_ids)
+        score_parts.append(idf * weights * factor)
+    if not id_parts:
+        return np.zeros(0, dtype=np.int32), np.zeros(0)
+    doc_ids, scores = np.concatenate(id_parts), np.concatenate(score_parts)
+    if len(id_parts) > 1:
+        # Posting lists are sorted and unique; across expansions keep each doc's best score
+        order = np.lexsort((-scores, doc_ids))
+        doc_ids, scores = doc_ids[order], scores[order]
+        first = np.ones(len(doc_ids), dtype=bool)
+        first[1:] = doc_ids[1:] != doc_ids[:-1]
+        doc_ids, scores = doc_ids[first], scores[first]
+    return doc_ids, scores
+
+
+def _match_terms(index, terms, prefix, fuzzy):
+    """
+    Doc ids (ascending) matching every term, with their summed scores. The work is
+    proportional to the matched postings, not to the number of docs.
+    """
+    import numpy as np
+
+    hits, scores = np.zeros(0, dtype=np.int32), np.zeros(0)
+    for position, term in enumerate(terms):
+        expansions = _expand_term(index, term, prefix and position == len(terms) - 1, fuzzy)
+        doc_ids, term_scores = _term_scores(index, expansions)
+        if position == 0:
+            hits, scores = doc_ids, term_scores
+        else:
+            hits, mine, theirs = np.intersect1d(hits, doc_ids, assume_unique=True, return_indices=True)
+            scores = scores[mine] + term_scores[theirs]
+        if not len(hits):
+            break
+    return hits, scores
+
+
+def _top_page(hits, scores, start, stop):
+    """
+    hits[start:stop] and their scores in (score desc, doc id asc) order without
+    sorting every hit: only hits scoring at least the stop-th best score are ordered.
+    """
+    import numpy as np
+
+    if stop < len(hits):
+        cutoff = np.partition(scores, len(hits) - stop)[len(hits) - stop]
+        keep = scores >= cutoff
+        hits, scores = hits[keep], scores[keep]
+    order = np.lexsort((hits, -scores))[start:stop]
+    return hits[order], scores[order]
+
+
+def search(index, table, query="", filters=None, prefix=True, fuzzy=False, page=1, page_size=50,
+           start_date=None, end_date=None, amount_sign=None):
+    """
+    Ranked search over the index. All query terms must match (AND); with `prefix`
+    the last term also matches as a prefix, with `fuzzy` misspelled terms match by
+    trigram similarity, and a query that finds nothing as typed is retried with
+    `fuzzy`. `filters` ({facet field: [values]}), the inclusive ISO date range and
+    `amount_sign` ("income" or "expense") narrow the hits. Returns a page of rows,
+    read from `table` (the TransactionTable the index was built from), plus facet
+    counts over all hits.
+    """
+    import numpy as np
+
+    if len(table) != index["doc_count"]:
+        raise ValueError(f"Search index covers {index['doc_count']} rows but the table has {len(table)}; re-run extract")
+    if amount_sign and amount_sign not in AMOUNT_SIGNS:
+        raise ValueError(f"amount_sign must be one of {', '.join(AMOUNT_SIGNS)}")
+    for value in (start_date, end_date):
+        if value and day_ordinal(value) == MISSING_DAY:
+            raise ValueError(f"Invalid date {value!r}; expected YYYY-MM-DD")
+
+    terms = tokenize(query)
+    page = max(1, int(page))
+    page_size = max(1, int(page_size))
+    start = (page - 1) * page_size
+    stop = start + page_size
+
+    page_scores = None
+    if not terms:
+        keep, facets = _apply_filters(index, table, None, filters, start_date, end_date, amount_sign)
+        if keep is None:
+            total = index["doc_count"]
+            page_ids = np.arange(start, min(stop, total))
+        else:
+            hits = np.flatnonzero(keep)
+            total = len(hits)
+            page_ids = hits[start:stop]
+    else:
+        hits, scores = _match_terms(index, terms, prefix, fuzzy)
+        if not len(hits) and not fuzzy:
+            # Nothing matched as typed; tolerate typos before giving up
+            fuzzy = True
+            hits, scores = _match_terms(index, terms, prefix, fuzzy)
+        keep, facets = _apply_filters(index, table, hits, filters, start_date, end_date, amount_sign)
+        if keep is not None:
+            hits, scores = hits[keep], scores[keep]
+        total = len(hits)
+        page_ids, page_scores = _top_page(hits, scores, start, stop)
+
+    rows = index["rows"]
+    results = []
+    for position, doc_id in enumerate(page_ids):
+        row = table.record(int(rows[doc_id]))
+        if page_scores is not None:
+            row["_score"] = round(float(page_scores[position]), 4)
+        results.append(row)
+
+    return {
+        "query": query,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "fuzzy": bool(fuzzy and terms),
+        "results": results,
+        "facets": facets,
+    }
@@ -0,0 +1,273 @@
+"""
+Compact, typed, column-oriented in-memory view of transactions.csv.
+
+app.py keeps one shared instance per file version instead of rebuilding a
+list of all-string dicts on every request: amounts are float64, dates are
+int32 day ordinals, and low-cardinality text fields are dictionary-encoded
+(one copy of each distinct string plus an int32 code per row).
+"""
+import csv
+import gzip
+import json
+import math
+import os
+from array import array
+from datetime import date
+
+FIELDNAMES = [
+    "transaction_id", "date", "description", "status",
+    "amount_value", "amount_currency",
+    "account_name", "account_type", "account_provider", "account_display",
+    "category_name", "category_type", "category_id",
+    "merchant_name"
+]
+
+# Repeated across rows; stored once per distinct value
+DICTIONARY_FIELDS = [
+    "date", "status",
+    "account_name", "account_type", "account_provider", "account_display",
+    "category_name", "category_type", "category_id",
+    "merchant_name"
+]
+
+# Mostly unique per row; stored as plain string lists
+TEXT_FIELDS = ["transaction_id", "description", "amount_currency"]
+
+MISSING_DAY = -1
+
+# date32 stores days since 1970-01-01; the table uses proleptic ordinals
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Written by `python -m src.cli extract --format feather` (see src/columnar.py)
+ARROW_FILENAME = os.path.join("columnar", "transactions.arrow")
+
+
+def day_ordinal(value):
+    """
+    "2024-05-01" (optionally followed by a time) -> proleptic Gregorian ordinal, or MISSING_DAY.
+    """
+    try:
+        return date.fromisoformat(value[:10]).toordinal()
+    except (TypeError, ValueError):
+        return MISSING_DAY
+
+
+class DictionaryColumn:
+    """
+    Distinct values plus an int32 code per row.
+    """
+
+    def __init__(self):
+        self.values = []
+        self.codes = array('i')
+        self._lookup = {}
+
+    def append(self, value):
+        code = self._lookup.get(value)
+        if code is None:
+            code = len(self.values)
+            self._lookup[value] = code
+            self.values.append(value)
+        self.codes.append(code)
+
+    @classmethod
+    def from_arrow(cls, column):
+        """
+        Wraps a single-chunk Arrow dictionary array; the int32 indices are used in place.
+        """
+        self = cls()
+        self.values = column.dictionary.to_pylist()
+        self.codes = column.indices.to_numpy(zero_copy_only=False)
+        self._lookup = {value: code for code, value in enumerate(self.values)}
+        return self
+
+    def code_of(self, value):
+        return self._lookup.get(value)
+
+    def __getitem__(self, row):
+        return self.values[self.codes[row]]
+
+    def __len__(self):
+        return len(self.codes)
+
+
+class TransactionTable:
+    def __init__(self):
+        self.amount = array('d')
+        self.day = array('i')
+        self.dictionary = {field: DictionaryColumn() for field in DICTIONARY_FIELDS}
+        self.text = {field: [] for field in TEXT_FIELDS}
+        self._all_json_gzip = None
+
+    def __len__(self):
+        return len(self.amount)
+
+    def append(self, row):
+        amount = row.get("amount_value", "")
+        try:
+            self.amount.append(float(amount) if amount != "" else math.nan)
+        except ValueError:
+            self.amount.append(math.nan)
+        self.day.append(day_ordinal(row.get("date", "")))
+        for field, column in self.dictionary.items():
+            column.append(row.get(field, ""))
+        for field, column in self.text.items():
+            column.append(row.get(field, ""))
+
+    @classmethod
+    def from_rows(cls, rows):
+        table = cls()
+        for row in rows:
+            table.append(row)
+        return table
+
+    @classmethod
+    def from_csv(cls, csv_path):
+        with open(csv_path, newline='', encoding='utf-8') as csvfile:
+            return cls.from_rows(csv.DictReader(csvfile))
+
+    @classmethod
+    def from_arrow(cls, table):
+        """
+        Builds the table from a pyarrow Table with the columnar.py schema. On a
+        memory-mapped file the amount and dictionary code columns stay views of
+        the mapped buffers; only the text columns become Python strings.
+        """
+        import numpy as np
+
+        self = cls()
+        if table.num_rows == 0:
+            return self
+        table = table.combine_chunks()
+        amount = table.column("amount_value").chunk(0)
+        if amount.null_count:
+            amount = amount.fill_null(math.nan)
+        self.amount = amount.to_numpy(zero_copy_only=False)
+        days = table.column("day").chunk(0).cast("int32").fill_null(MISSING_DAY - EPOCH_ORDINAL)
+        # Ordinals stay well inside int32, matching the CSV path's array('i')
+        self.day = days.to_numpy() + np.int32(EPOCH_ORDINAL)
+        for field in DICTIONARY_FIELDS:
+            self.dictionary[field] = DictionaryColumn.from_arrow(table.column(field).chunk(0))
+        for field in TEXT_FIELDS:
+            self.text[field] = table.column(field).to_pylist()
+        return self
+
+    @classmethod
+    def from_feather(cls, arrow_path):
+        from src.columnar import read_feather
+        return cls.from_arrow(read_feather(arrow_path))
+
+    @classmethod
+    def load(cls, csv_path):
+        """
+        Prefers the memory-mapped Arrow copy next to transactions.csv when it is at least
+        as new as the CSV (and pyarrow is installed); otherwise parses the CSV.
+        """
+        arrow_path = os.path.join(os.path.dirname(csv_path), ARROW_FILENAME)
+        if os.path.exists(arrow_path) and os.path.getmtime(arrow_path) >= os.path.getmtime(csv_path):
+            try:
+                return cls.from_feather(arrow_path)
+            except ImportError:
+                pass
+        return cls.from_csv(csv_path)
+
+    def filter(self, start_date=None, end_date=None, **equals):
+        """
+        Row ids (an int64 array) matching an inclusive ISO date range and exact values
+        on dictionary-encoded fields.
+        """
+        import numpy as np
+
+        mask = np.ones(len(self), dtype=bool)
+        for field, value in equals.items():
+            if value is None or value == "":
+                continue
+            if field not in self.dictionary:
+                raise KeyError(f"Cannot filter on {field}")
+            column = self.dictionary[field]
+            code = column.code_of(value)
+            if code is None:
+                return np.empty(0, dtype=np.int64)
+            mask &= np.asarray(column.codes) == code
+
+        if start_date or end_date:
+            low = day_ordinal(start_date) if start_date else MISSING_DAY + 1
+            high = day_ordinal(end_date) if end_date else date.max.toordinal()
+            day = np.asarray(self.day)
+            mask &= (day >= low) & (day <= high)
+
+        return np.flatnonzero(mask)
+
+    def _amounts(self, rows):
+        import numpy as np
+
+        amount = np.asarray(self.amount, dtype=np.float64)
+        return amount if rows is None else amount[np.asarray(rows, dtype=np.int64)]
+
+    def totals(self, rows=None):
+        """
+        Sum, count, income and expenses (as a positive magnitude) over the given row ids.
+        """
+        import numpy as np
+
+        amount = self._amounts(rows)
+        amount = amount[~np.isnan(amount)]
+        income = amount[amount > 0].sum()
+        expenses = 0.0 - amount[amount <= 0].sum()
+        return {"sum": round(float(amount.sum()), 2), "count": int(len(amount)),
+                "income": round(float(income), 2), "expenses": round(float(expenses), 2)}
+
+    def group_totals(self, field, rows=None):
+        """
+        totals() per distinct value of a dictionary-encoded field, one np.bincount per measure.
+        """
+        import numpy as np
+
+        column = self.dictionary[field]
+        codes = np.asarray(column.codes, dtype=np.int64)
+        if rows is not None:
+            codes = codes[np.asarray(rows, dtype=np.int64)]
+        amount = self._amounts(rows)
+        groups = len(column.values)
+
+        present = np.bincount(codes, minlength=groups) > 0
+        valid = ~np.isnan(amount)
+        codes, amount = codes[valid], amount[valid]
+        positive = amount > 0
+        count = np.bincount(codes, minlength=groups)
+        total = np.bincount(codes, weights=amount, minlength=groups)
+        income = np.bincount(codes[positive], weights=amount[positive], minlength=groups)
+        expenses = 0.0 - np.bincount(codes[~positive], weights=amount[~positive], minlength=groups)
+        return [
+            {"key": column.values[code], "sum": round(float(total[code]), 2), "count": int(count[code]),
+             "income": round(float(income[code]), 2), "expenses": round(float(expenses[code]), 2)}
+            for code in sorted(np.flatnonzero(present).tolist(), key=lambda code: column.values[code])
+        ]
+
+    def record(self, row):
+        amount = self.amount[row]
+        values = {field: column[row] for field, column in self.dictionary.items()}
+        values.update({field: column[row] for field, column in self.text.items()})
+        values["amount_value"] = "" if math.isnan(amount) else amount
+        return {field: values[field] for field in FIELDNAMES}
+
+    def to_records(self, rows=None):
+        rows = range(len(self)) if rows is None else rows
+        if hasattr(rows, "tolist"):
+            rows = rows.tolist()
+        return [self.record(row) for row in rows]
+
+    def to_json(self, rows=None):
+        """
+        Serialized records, built on demand.
+        """
+        return json.dumps(self.to_records(rows)).encode("utf-8")
+
+    def to_json_gzip(self):
+        """
+        Gzip-compressed to_json() of every row. Only the compressed copy is cached,
+        a fraction of the size of the plain payload.
+        """
+        if self._all_json_gzip is None:
+            self._all_json_gzip = gzip.compress(self.to_json())
+        return self._all_json_gzip
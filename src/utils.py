@@ -1,32 +1,82 @@
+import csv
+import json
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+
+# Bump an extractor's version whenever its output changes so batch
+# re-extraction (src/batch.py) knows previously written CSVs are stale
+EXTRACTOR_VERSIONS = {
+    "extract_card_balances_to_csv": 1,
+    "extract_cash_balances_to_csv": 1,
+    "extract_investment_balances_to_csv": 1,
+    "extract_investment_history_to_csv": 1,
+    "extract_transactions_to_csv": 1,
+}
+
+# Process umask, read once (os.umask can only be queried by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def atomic_open(path, mode='w', **kwargs):
+    """
+    Opens a temporary file next to `path` and renames it over `path` only once
+    writing succeeded, so readers never see a truncated or half-written file.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix="-" + os.path.basename(path))
+    try:
+        # mkstemp creates 0600 files; give the result the permissions open() would have
+        os.chmod(temp_path, 0o666 & ~_UMASK)
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
 def save_to_csv(data, filename):
     import pandas as pd
     df = pd.DataFrame(data)
-    df.to_csv(filename, index=False)
+    with atomic_open(filename, 'w', newline='') as f:
+        df.to_csv(f, index=False)
 
 def save_to_json(data, filename):
-    import json
-    with open(filename, 'w') as json_file:
+    with atomic_open(filename, 'w') as json_file:
         json.dump(data, json_file)
 
 def load_from_json(filename):
-    import json
     with open(filename, 'r') as json_file:
         return json.load(json_file)
 
 def format_currency(value):
     return "${:,.2f}".format(value)
 
+def parse_money(value):
+    """
+    Parses "$1,234.56" / "-$12.00" / "12.5" into a float (0.0 when empty or invalid).
+    """
+    try:
+        return float(str(value).replace("$", "").replace(",", "").strip() or 0)
+    except ValueError:
+        return 0.0
+
 def extract_data(data, keys):
     return [{key: item[key] for key in keys} for item in data]
 
-def extract_card_balances_to_csv(card_balances_json, output_csv="card_balances.csv"):
+def extract_card_balances_to_csv(card_balances_json, output_csv="card_balances.csv", raise_errors=False):
     """
     Extracts credit card balance information from card_balances.json
     using structural analysis instead of name matching.
+    Errors are printed and 0 returned unless `raise_errors` is set.
     """
-    import csv
-    import re
-    
     cards = []
     processed_account_ids = set()  # To avoid duplicates
     
@@ -167,7 +217,7 @@ def extract_card_balances_to_csv(card_balances_json, output_csv="card_balances.c
         # Write to CSV
         if cards:
             fieldnames = ["account_id", "card_name", "balance", "credit_usage", "last_updated", "card_type", "image_url"]
-            with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
+            with atomic_open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()
                 writer.writerows(cards)
@@ -179,113 +229,330 @@ def extract_card_balances_to_csv(card_balances_json, output_csv="card_balances.c
                 print(f"  - {card['account_id']}: {card['card_name']} | {card['balance']} ({card['credit_usage']}) - {card['image_url']}")
         else:
             print("[ERROR] No card data found in the JSON")
+
+        return len(cards)
     
     except Exception as e:
+        if raise_errors:
+            raise
         print(f"[ERROR] Failed to extract card balances: {e}")
+        return 0
+
+
+# ---------------------------------------------------------------------------
+# Declarative extraction plans for networthByAccountType layouts
+#
+# Field paths and parsers are declared once per view typename and compiled
+# into accessor functions. One traversal of cards[].item.views[] fills every
+# output of a plan, and anything the plan doesn't recognise is reported as
+# schema drift instead of silently producing an empty CSV.
+# ---------------------------------------------------------------------------
+
+NETWORTH_VIEWS_PATH = "data.prime.networthByAccountType.cards[].item.views[]"
+
+
+def compile_path(path):
+    """
+    Compiles "a.b[].c" into a function returning the list of values found at that path.
+    A "[]" suffix iterates a list; missing keys and non-dict values yield nothing.
+    """
+    steps = []
+    for segment in path.split("."):
+        if segment.endswith("[]"):
+            steps.append((segment[:-2], True))
+        else:
+            steps.append((segment, False))
+
+    def accessor(obj):
+        current = [obj]
+        for key, iterate in steps:
+            found = []
+            for value in current:
+                if not isinstance(value, dict):
+                    continue
+                child = value.get(key)
+                if child is None:
+                    continue
+                if iterate:
+                    if isinstance(child, list):
+                        found.extend(child)
+                else:
+                    found.append(child)
+            current = found
+            if not current:
+                break
+        return current
+
+    return accessor
+
+
+def first_span_text(spans, prefixes=None):
+    """
+    First non-empty stripped span text, optionally only texts starting with one of `prefixes`.
+    """
+    for span in spans or []:
+        text = (span.get("text") or "").strip() if isinstance(span, dict) else ""
+        if text and (prefixes is None or text.startswith(prefixes)):
+            return text
+    return ""
+
 
+def parse_status_dot(text):
+    """
+    "Chase (...0172)\\n4 hr ago" -> ("Chase", "...0172", "4 hr ago")
+    """
+    name = number = updated = ""
+    if text:
+        lines = text.split('\n')
+        first = lines[0].strip()
+        if '(' in first and ')' in first:
+            name = first.split('(')[0].strip()
+            number = first.split('(')[1].split(')')[0]
+        if len(lines) >= 2:
+            updated = lines[1].strip()
+    return name, number, updated
 
-def extract_cash_balances_to_csv(cash_balances_json, output_csv="cash_balances.csv"):
+
+class ExtractionPlan:
+    """
+    rules: {typename: [(output, levels, finish)]}
+      levels: [(iterate_path or None, [(field, path, parser), ...]), ...] - each level iterates
+              `iterate_path` below the previous one and collects its fields into the row
+      finish: row -> row (or None to drop it)
+    ignore: typenames that are expected but not extracted
+    """
+
+    def __init__(self, name, rules, ignore=(), root_path=NETWORTH_VIEWS_PATH):
+        self.name = name
+        self.ignore = set(ignore)
+        self.root = compile_path(root_path)
+        self.rules = {}
+        for typename, specs in rules.items():
+            compiled_specs = []
+            for output, levels, finish in specs:
+                compiled_levels = [
+                    (compile_path(iterate) if iterate else None,
+                     [(field, path, compile_path(path), parser) for field, path, parser in fields])
+                    for iterate, fields in levels
+                ]
+                compiled_specs.append((output, compiled_levels, finish))
+            self.rules[typename] = compiled_specs
+        self.outputs = sorted({output for specs in rules.values() for output, _, _ in specs})
+
+    def _rows(self, obj, levels, row, tried, misses):
+        """
+        Yields the rows below `obj`. `tried` and `misses` count, per field path, the
+        items of that path's level it was looked up on and how often it found nothing.
+        """
+        iterate, fields = levels[0]
+        for item in (iterate(obj) if iterate else [obj]):
+            current = dict(row)
+            for field, path, accessor, parser in fields:
+                values = accessor(item)
+                tried[path] = tried.get(path, 0) + 1
+                if not values:
+                    misses[path] = misses.get(path, 0) + 1
+                current[field] = parser(values[0] if values else None)
+            if len(levels) > 1:
+                yield from self._rows(item, levels[1:], current, tried, misses)
+            else:
+                yield current
+
+    def run(self, payload):
+        """
+        Single pass over the views. Returns ({output: [rows]}, drift report).
+        """
+        results = {output: [] for output in self.outputs}
+        unmatched = {}
+        attempts = {}
+        tried = {output: {} for output in self.outputs}
+        misses = {output: {} for output in self.outputs}
+        views = self.root(payload)
+        for view in views:
+            typename = view.get("__typename", "") if isinstance(view, dict) else ""
+            specs = self.rules.get(typename)
+            if specs is None:
+                if typename not in self.ignore:
+                    unmatched[typename] = unmatched.get(typename, 0) + 1
+                continue
+            for output, levels, finish in specs:
+                for row in self._rows(view, levels, {}, tried[output], misses[output]):
+                    attempts[output] = attempts.get(output, 0) + 1
+                    row = finish(row) if finish else row
+                    if row is not None:
+                        results[output].append(row)
+
+        drift = {
+            "views": len(views),
+            "unmatched_typenames": unmatched,
+            "empty_outputs": [output for output in self.outputs if not results[output]],
+            "missing_paths": misses,
+            "paths_tried": tried,
+            "rows_considered": attempts,
+        }
+        return results, drift
+
+    def report_drift(self, drift):
+        """
+        Prints what the payload had that the plan didn't expect. Returns True if anything drifted.
+        """
+        drifted = False
+        if not drift["views"]:
+            print(f"[WARN] {self.name}: no views found at {NETWORTH_VIEWS_PATH}")
+            return True
+        if drift["unmatched_typenames"]:
+            # New layout chrome shows up here first; only a warning if it also costs us rows
+            found = ", ".join(f"{name or '<none>'} x{count}" for name, count in sorted(drift["unmatched_typenames"].items()))
+            print(f"[LOG] {self.name}: unhandled view types: {found}")
+        for output in drift["empty_outputs"]:
+            drifted = True
+            print(f"[WARN] {self.name}: no {output} rows extracted from {drift['views']} views")
+        for output, misses in sorted(drift["missing_paths"].items()):
+            tried = drift["paths_tried"][output]
+            for path, count in sorted(misses.items()):
+                # Compared against the items of the path's own level, not the output's row count
+                if count >= tried[path]:
+                    drifted = True
+                    print(f"[WARN] {self.name}: {output} path {path} never matched in {count} items")
+        return drifted
+
+
+def _account_row(institution_field):
+    def finish(row):
+        status = row.pop("_status")
+        if not (row["account_name"] and row["balance"]):
+            return None
+        name, number, updated = parse_status_dot(status)
+        return {
+            "account_name": row["account_name"],
+            "balance": row["balance"],
+            institution_field: name,
+            "account_number": number,
+            "last_updated": updated,
+            "image_url": row["image_url"],
+        }
+    return finish
+
+
+def _account_fields():
+    return [(None, [
+        ("account_name", "rowTitle.spans", first_span_text),
+        ("balance", "rowValue.spans", lambda spans: first_span_text(spans, ("$", "-$"))),
+        ("_status", "rowStatusDot.statusDotText.spans", first_span_text),
+        ("image_url", "rowPrimaryImage.imageUrl", lambda url: url if url is not None else ""),
+    ])]
+
+
+def _history_row(row):
+    return row if row["date"] and row["value"] else None
+
+
+HISTORY_LEVELS = [
+    ("dataVisualizationGroupDataSets[]", [
+        ("period", "dataSetKey", lambda key: key if key is not None else ""),
+    ]),
+    ("dataVisualizationDataSet.lines[].points[]", [
+        ("date", "xValueLabel.spans", first_span_text),
+        ("value", "yValueLabel.spans", lambda spans: first_span_text(spans, ("$",))),
+        ("raw_value", "yValue", lambda value: value if value is not None else ""),
+        ("data_point_index", "xValue", lambda value: value if value is not None else ""),
+    ]),
+]
+
+# Layout chrome that never carries account data
+LAYOUT_VIEW_TYPES = {"KPLSectionHeaderView", "KPLDividerView", "KPLButtonView", "KPLParagraphView", "KPLNoticeView"}
+
+CASH_PLAN = ExtractionPlan("cash_balances", {
+    "KPLRowView": [("accounts", _account_fields(), _account_row("bank"))],
+}, ignore=LAYOUT_VIEW_TYPES | {"FabricDataVisualizationGroup"})
+
+INVESTMENT_PLAN = ExtractionPlan("investment_balances", {
+    "KPLRowView": [("accounts", _account_fields(), _account_row("broker"))],
+    "FabricDataVisualizationGroup": [("history", HISTORY_LEVELS, _history_row)],
+}, ignore=LAYOUT_VIEW_TYPES)
+
+CASH_FIELDNAMES = ["account_name", "balance", "bank", "account_number", "last_updated", "image_url"]
+INVESTMENT_FIELDNAMES = ["account_name", "balance", "broker", "account_number", "last_updated", "image_url"]
+HISTORY_FIELDNAMES = ["date", "value", "raw_value", "period", "data_point_index"]
+
+
+def _write_rows_csv(rows, fieldnames, output_csv):
+    with atomic_open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _write_accounts(accounts, fieldnames, output_csv, label, institution_label):
+    if accounts:
+        _write_rows_csv(accounts, fieldnames, output_csv)
+        print(f"[SUCCESS] Extracted {len(accounts)} {label} account records to {output_csv}")
+        institution = fieldnames[2]
+        for account in accounts:
+            print(f"  - {account['account_name']}: {account['balance']} | {institution_label}: {account[institution]} | Account: {account['account_number']} | Updated: {account['last_updated']}")
+    else:
+        print(f"[ERROR] No {label} account data found in the JSON")
+    return len(accounts)
+
+
+def _write_history(history_data, output_csv):
+    if history_data:
+        _write_rows_csv(history_data, HISTORY_FIELDNAMES, output_csv)
+        print(f"[SUCCESS] Extracted {len(history_data)} investment history records to {output_csv}")
+
+        # Show first few and last few entries
+        print(f"  First entries:")
+        for i, record in enumerate(history_data[:3]):
+            print(f"    {record['date']}: {record['value']} (raw: {record['raw_value']})")
+
+        if len(history_data) > 6:
+            print(f"  ...")
+            print(f"  Last entries:")
+            for record in history_data[-3:]:
+                print(f"    {record['date']}: {record['value']} (raw: {record['raw_value']})")
+    else:
+        print("[ERROR] No investment history data found in the JSON")
+    return len(history_data)
+
+
+def extract_cash_balances_to_csv(cash_balances_json, output_csv="cash_balances.csv", raise_errors=False):
     """
     Extracts basic cash balance information from cash_balances.json object and saves to CSV.
-    Simple extraction focusing on the key data points.
+    Runs CASH_PLAN over the KPLRowView account rows.
+    Errors are printed and 0 returned unless `raise_errors` is set.
     """
-    import csv
-    
     try:
-        accounts = []
-        
-        # Navigate to the cards array
-        cards = cash_balances_json.get("data", {}).get("prime", {}).get("networthByAccountType", {}).get("cards", [])
-        
-        for card in cards:
-            item = card.get("item", {})
-            
-            # Skip the header section - we only want actual accounts
-            
-            # Look for individual account rows
-            views = item.get("views", [])
-            for view in views:
-                if view.get("__typename") == "KPLRowView":
-                    account_name = ""
-                    balance = ""
-                    bank_info = ""
-                    image_url = ""
-                    
-                    # Extract account name from row title
-                    row_title = view.get("rowTitle", {}).get("spans", [])
-                    for span in row_title:
-                        text = span.get("text", "").strip()
-                        if text:
-                            account_name = text
-                            break
-                    
-                    # Extract balance from row value
-                    row_value = view.get("rowValue", {}).get("spans", [])
-                    for span in row_value:
-                        text = span.get("text", "").strip()
-                        if text.startswith("$") or text.startswith("-$"):
-                            balance = text
-                            break
-                    
-                    # Extract bank info from status dot
-                    status_dot = view.get("rowStatusDot", {})
-                    if status_dot:
-                        status_spans = status_dot.get("statusDotText", {}).get("spans", [])
-                        for span in status_spans:
-                            text = span.get("text", "").strip()
-                            if text:
-                                bank_info = text
-                                break
-                    
-                    # Extract image URL
-                    row_image = view.get("rowPrimaryImage", {})
-                    if row_image:
-                        image_url = row_image.get("imageUrl", "")
-                    
-                    # Parse bank info (format: "Chase (...0172)\n4 hr ago")
-                    bank_name = ""
-                    account_number = ""
-                    last_updated = ""
-                    
-                    if bank_info:
-                        lines = bank_info.split('\n')
-                        if len(lines) >= 1:
-                            bank_line = lines[0].strip()
-                            if '(' in bank_line and ')' in bank_line:
-                                bank_name = bank_line.split('(')[0].strip()
-                                account_part = bank_line.split('(')[1].split(')')[0]
-                                account_number = account_part
-                        if len(lines) >= 2:
-                            last_updated = lines[1].strip()
-                    
-                    # Only add if we have the essential data
-                    if account_name and balance:
-                        accounts.append({
-                            "account_name": account_name,
-                            "balance": balance,
-                            "bank": bank_name,
-                            "account_number": account_number,
-                            "last_updated": last_updated,
-                            "image_url": image_url
-                        })
-        
-        # Write to CSV
-        if accounts:
-            fieldnames = ["account_name", "balance", "bank", "account_number", "last_updated", "image_url"]
-            with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(accounts)
-            
-            print(f"[SUCCESS] Extracted {len(accounts)} cash account records to {output_csv}")
-            
-            for account in accounts:
-                print(f"  - {account['account_name']}: {account['balance']} | Bank: {account['bank']} | Account: {account['account_number']} | Updated: {account['last_updated']}")
-        else:
-            print("[ERROR] No cash account data found in the JSON")
-    
+        results, drift = CASH_PLAN.run(cash_balances_json)
+        CASH_PLAN.report_drift(drift)
+        return _write_accounts(results["accounts"], CASH_FIELDNAMES, output_csv, "cash", "Bank")
     except Exception as e:
+        if raise_errors:
+            raise
         print(f"[ERROR] Failed to extract cash balances: {e}")
+        return 0
+
+
+def extract_investments_to_csv(investment_balances_json, balances_csv="investment_balances.csv", history_csv="investment_history.csv",
+                               raise_errors=False):
+    """
+    Extracts investment account balances and history from investment_balances.json in a single pass.
+    Either output can be skipped by passing None. Returns (balance records, history records).
+    Errors are printed and (0, 0) returned unless `raise_errors` is set.
+    """
+    try:
+        results, drift = INVESTMENT_PLAN.run(investment_balances_json)
+        INVESTMENT_PLAN.report_drift(drift)
+        balances = history = 0
+        if balances_csv:
+            balances = _write_accounts(results["accounts"], INVESTMENT_FIELDNAMES, balances_csv, "investment", "Broker")
+        if history_csv:
+            history = _write_history(results["history"], history_csv)
+        return balances, history
+    except Exception as e:
+        if raise_errors:
+            raise
+        print(f"[ERROR] Failed to extract investments: {e}")
+        return 0, 0
 
 
 def extract_investment_balances_to_csv(investment_balances_json, output_csv="investment_balances.csv"):
@@ -293,103 +560,7 @@ def extract_investment_balances_to_csv(investment_balances_json, output_csv="inv
     Extracts basic investment balance information from investment_balances.json object and saves to CSV.
     Simple extraction focusing on individual accounts with date history.
     """
-    import csv
-    
-    try:
-        accounts = []
-        
-        # Navigate to the cards array
-        cards = investment_balances_json.get("data", {}).get("prime", {}).get("networthByAccountType", {}).get("cards", [])
-        
-        for card in cards:
-            item = card.get("item", {})
-            
-            # Skip the header section - we only want actual accounts
-            
-            # Look for individual account rows
-            views = item.get("views", [])
-            for view in views:
-                if view.get("__typename") == "KPLRowView":
-                    account_name = ""
-                    balance = ""
-                    broker_info = ""
-                    image_url = ""
-                    
-                    # Extract account name from row title
-                    row_title = view.get("rowTitle", {}).get("spans", [])
-                    for span in row_title:
-                        text = span.get("text", "").strip()
-                        if text:
-                            account_name = text
-                            break
-                    
-                    # Extract balance from row value
-                    row_value = view.get("rowValue", {}).get("spans", [])
-                    for span in row_value:
-                        text = span.get("text", "").strip()
-                        if text.startswith("$") or text.startswith("-$"):
-                            balance = text
-                            break
-                    
-                    # Extract broker info from status dot
-                    status_dot = view.get("rowStatusDot", {})
-                    if status_dot:
-                        status_spans = status_dot.get("statusDotText", {}).get("spans", [])
-                        for span in status_spans:
-                            text = span.get("text", "").strip()
-                            if text:
-                                broker_info = text
-                                break
-                    
-                    # Extract image URL
-                    row_image = view.get("rowPrimaryImage", {})
-                    if row_image:
-                        image_url = row_image.get("imageUrl", "")
-                    
-                    # Parse broker info (format: "Robinhood (...3105)\n4 hr ago")
-                    broker_name = ""
-                    account_number = ""
-                    last_updated = ""
-                    
-                    if broker_info:
-                        lines = broker_info.split('\n')
-                        if len(lines) >= 1:
-                            broker_line = lines[0].strip()
-                            if '(' in broker_line and ')' in broker_line:
-                                broker_name = broker_line.split('(')[0].strip()
-                                account_part = broker_line.split('(')[1].split(')')[0]
-                                account_number = account_part
-                        if len(lines) >= 2:
-                            last_updated = lines[1].strip()
-                    
-                    # Only add if we have the essential data
-                    if account_name and balance:
-                        accounts.append({
-                            "account_name": account_name,
-                            "balance": balance,
-                            "broker": broker_name,
-                            "account_number": account_number,
-                            "last_updated": last_updated,
-                            "image_url": image_url
-                        })
-        
-        # Write to CSV
-        if accounts:
-            fieldnames = ["account_name", "balance", "broker", "account_number", "last_updated", "image_url"]
-            with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(accounts)
-            
-            print(f"[SUCCESS] Extracted {len(accounts)} investment account records to {output_csv}")
-            
-            for account in accounts:
-                print(f"  - {account['account_name']}: {account['balance']} | Broker: {account['broker']} | Account: {account['account_number']} | Updated: {account['last_updated']}")
-        else:
-            print("[ERROR] No investment account data found in the JSON")
-    
-    except Exception as e:
-        print(f"[ERROR] Failed to extract investment balances: {e}")
+    return extract_investments_to_csv(investment_balances_json, output_csv, None)[0]
 
 
 def extract_investment_history_to_csv(investment_balances_json, output_csv="investment_history.csv"):
@@ -397,101 +568,15 @@ def extract_investment_history_to_csv(investment_balances_json, output_csv="inve
     Extracts historical investment data (dates and values) from investment_balances.json object and saves to CSV.
     Each row represents a data point with date and value for tracking investment performance over time.
     """
-    import csv
-    
-    try:
-        history_data = []
-        
-        # Navigate to the cards array
-        cards = investment_balances_json.get("data", {}).get("prime", {}).get("networthByAccountType", {}).get("cards", [])
-        
-        for card in cards:
-            item = card.get("item", {})
-            views = item.get("views", [])
-            
-            for view in views:
-                # Look for data visualization groups (charts/graphs)
-                if view.get("__typename") == "FabricDataVisualizationGroup":
-                    data_sets = view.get("dataVisualizationGroupDataSets", [])
-                    
-                    for data_set in data_sets:
-                        data_set_key = data_set.get("dataSetKey", "")
-                        visualization_data = data_set.get("dataVisualizationDataSet", {})
-                        lines = visualization_data.get("lines", [])
-                        
-                        for line in lines:
-                            points = line.get("points", [])
-                            
-                            for point in points:
-                                # Extract date from xValueLabel
-                                date = ""
-                                x_label = point.get("xValueLabel", {})
-                                if x_label:
-                                    x_spans = x_label.get("spans", [])
-                                    for span in x_spans:
-                                        text = span.get("text", "").strip()
-                                        if text:
-                                            date = text
-                                            break
-                                
-                                # Extract value from yValueLabel
-                                value = ""
-                                y_label = point.get("yValueLabel", {})
-                                if y_label:
-                                    y_spans = y_label.get("spans", [])
-                                    for span in y_spans:
-                                        text = span.get("text", "").strip()
-                                        if text and text.startswith("$"):
-                                            value = text
-                                            break
-                                
-                                # Get raw numeric value as well
-                                raw_value = point.get("yValue", "")
-                                
-                                # Only add if we have both date and value
-                                if date and value:
-                                    history_data.append({
-                                        "date": date,
-                                        "value": value,
-                                        "raw_value": raw_value,
-                                        "period": data_set_key,
-                                        "data_point_index": point.get("xValue", "")
-                                    })
-        
-        # Write to CSV
-        if history_data:
-            fieldnames = ["date", "value", "raw_value", "period", "data_point_index"]
-            with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(history_data)
-            
-            print(f"[SUCCESS] Extracted {len(history_data)} investment history records to {output_csv}")
-            
-            # Show first few and last few entries
-            print(f"  First entries:")
-            for i, record in enumerate(history_data[:3]):
-                print(f"    {record['date']}: {record['value']} (raw: {record['raw_value']})")
-            
-            if len(history_data) > 6:
-                print(f"  ...")
-                print(f"  Last entries:")
-                for record in history_data[-3:]:
-                    print(f"    {record['date']}: {record['value']} (raw: {record['raw_value']})")
-        else:
-            print("[ERROR] No investment history data found in the JSON")
-    
-    except Exception as e:
-        print(f"[ERROR] Failed to extract investment history: {e}")
+    return extract_investments_to_csv(investment_balances_json, None, output_csv)[1]
 
 
-def extract_transactions_to_csv(transactions_json, output_csv="transactions.csv"):
+def extract_transactions_to_csv(transactions_json, output_csv="transactions.csv", raise_errors=False):
     """
     Extracts transaction data from transactions.json and saves to CSV.
     Simple extraction of all transaction fields including account, category, and merchant info.
+    Errors are printed and 0 returned unless `raise_errors` is set.
     """
-    import csv
-    
     try:
         transactions = []
         
@@ -554,7 +639,7 @@ def extract_transactions_to_csv(transactions_json, output_csv="transactions.csv"
                 "category_name", "category_type", "category_id", 
                 "merchant_name"
             ]
-            with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
+            with atomic_open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()
                 writer.writerows(transactions)
@@ -577,7 +662,12 @@ def extract_transactions_to_csv(transactions_json, output_csv="transactions.csv"
                 print(f"    {transaction['date']}: {transaction['description'][:30]}... | {transaction['amount_currency']} | {transaction['account_name']}")
         else:
             print("[ERROR] No transaction data found in the JSON")
+
+        return len(transactions)
     
     except Exception as e:
+        if raise_errors:
+            raise
         print(f"[ERROR] Failed to extract transactions: {e}")
+        return 0
 
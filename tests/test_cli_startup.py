@@ -0,0 +1,45 @@
+"""
+Cold-start budget of the CLI, measured in a fresh interpreter through a real command path.
+"""
+import os
+import shutil
+
+import pytest
+
+from src.cli import DEFAULT_STARTUP_BUDGET_MS, measure_startup
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures")
+
+# Best of a few runs so a single slow process spawn on a busy machine doesn't fail the budget
+RUNS = 3
+
+
+def _fastest(argv=None, cwd=None):
+    reports = [measure_startup(argv, cwd=cwd) for _ in range(RUNS)]
+    for report in reports:
+        assert "error" not in report, report.get("error")
+    return min(reports, key=lambda report: report["total_ms"])
+
+
+@pytest.fixture
+def raw_data(tmp_path):
+    data_dir = tmp_path / "Data"
+    data_dir.mkdir()
+    shutil.copy(os.path.join(FIXTURES_DIR, "card_balances.json"), data_dir)
+    return tmp_path
+
+
+def test_import_within_budget():
+    report = _fastest()
+
+    assert report["heavy"] == []
+    assert report["total_ms"] < DEFAULT_STARTUP_BUDGET_MS
+
+
+def test_extract_cards_within_budget(raw_data):
+    report = _fastest(["extract", "--only", "cards"], cwd=raw_data)
+
+    assert report["exit_code"] == 0
+    assert (raw_data / "Data" / "current" / "card_balances.csv").exists()
+    assert report["heavy"] == []
+    assert report["total_ms"] < DEFAULT_STARTUP_BUDGET_MS